@@ -74,19 +74,28 @@ class DocBuilder:
             os.mkdir(self.doctreesDirectoryPath)
 
         print('WRITING DOCUMENTATION FILES')
-        writers.StaticFileCopier().run()
+        self.runWriter(writers.StaticFileCopier())
         try:
-            writers.IPythonNotebookReSTWriter().run()
+            self.runWriter(writers.IPythonNotebookReSTWriter())
         except OSError:
             raise ImportError('IPythonNotebookReSTWriter crashed; most likely cause: '
                               + 'no pandoc installed: https://github.com/jgm/pandoc/releases')
 
-        writers.ModuleReferenceReSTWriter().run()
-        writers.CorpusReferenceReSTWriter().run()
+        self.runWriter(writers.ModuleReferenceReSTWriter())
+        self.runWriter(writers.CorpusReferenceReSTWriter())
 
         if runSphinx:
             self.runSphinx()
 
+    @staticmethod
+    def runWriter(writer):
+        '''
+        Runs one documentation writer, printing its per-file messages
+        all at once when it finishes.
+        '''
+        with writer.bufferedReports():
+            writer.run()
+
     def runSphinx(self):
         try:
             import sphinx
@@ -10,13 +10,17 @@
 # Copyright:    Copyright © 2013-15 Michael Scott Asato Cuthbert and the music21 Project
 # License:      BSD, see license.txt
 # ------------------------------------------------------------------------------
+import concurrent.futures
+import contextlib
+from functools import lru_cache
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import re
 import shutil
-
-from more_itertools import windowed
+import sys
 
 from music21 import common
 from music21 import exceptions21
@@ -27,6 +31,10 @@ from . import iterators
 
 environLocal = environment.Environment('docbuild.writers')
 
+# used by IPythonNotebookReSTWriter.cleanConvertedNotebook
+_IPYTHON_PROMPT_PATTERN = re.compile(r'^In\[[\d ]+]:')
+_MANGLED_INTERNAL_REFERENCE = re.compile(r':(class|ref|func|meth|attr):``?(.*?)``?')
+
 class DocumentationWritersException(exceptions21.Music21Exception):
     pass
 
@@ -41,6 +49,17 @@ class _BuildDirectoryFilter(logging.Filter):
             return True
         return False
 
+@lru_cache(1)
+def _documentationPaths():
+    '''
+    Returns the documentation directory and its "source" and "autogenerated"
+    subdirectories as pathlib.Path objects.  Looked up once, since finding
+    the music21 root directory touches the filesystem.
+    '''
+    docBasePath = common.getRootFilePath() / 'documentation'
+    return docBasePath, docBasePath / 'source', docBasePath / 'autogenerated'
+
+
 class DocumentationWriter:
     '''
     Abstract base class for writers.
@@ -49,22 +68,65 @@ class DocumentationWriter:
     '''
     def __init__(self):
         self.outputDirectory = None
-        self.docBasePath = common.getRootFilePath() / 'documentation'
-        self.docSourcePath = self.docBasePath / 'source'
-        self.docGeneratedPath = self.docBasePath / 'autogenerated'
+        self.docBasePath, self.docSourcePath, self.docGeneratedPath = _documentationPaths()
+        self._reportBuffer = None
 
     def run(self):
         raise NotImplementedError
 
+    def report(self, message):
+        '''
+        Prints a progress message such as "WROTE   some/file.rst" --
+        or, within :meth:`bufferedReports`, saves it to print later.
+        '''
+        if self._reportBuffer is not None:
+            self._reportBuffer.append(message)
+        else:
+            print(message)
+
+    @contextlib.contextmanager
+    def bufferedReports(self):
+        '''
+        Context manager that holds back the messages sent to :meth:`report`
+        and prints them all in one write at the end, rather than one
+        write per file to a terminal that may flush every line.
+
+        >>> writer = DocumentationWriter()
+        >>> with writer.bufferedReports():
+        ...     writer.report('first')
+        ...     writer.report('second')
+        ...     print('done reporting')
+        done reporting
+        first
+        second
+        '''
+        self._reportBuffer = []
+        try:
+            yield
+        finally:
+            messages, self._reportBuffer = self._reportBuffer, None
+            if messages:
+                sys.stdout.write('\n'.join(messages) + '\n')
+
     # PUBLIC METHODS #
     def sourceToAutogenerated(self, sourcePath):
         '''
         converts a sourcePath to an outputPath
 
         generally speaking, substitutes "source" for "autogenerated"
+
+        >>> writer = DocumentationWriter()
+        >>> outputPath = writer.sourceToAutogenerated(writer.docSourcePath / 'about' / 'what.rst')
+        >>> outputPath.relative_to(writer.docGeneratedPath).as_posix()
+        'about/what.rst'
+
+        Paths outside the source directory are returned (resolved) but not changed.
         '''
-        outputPath = str(sourcePath.resolve()).replace(
-            str(self.docSourcePath), str(self.docGeneratedPath))
+        outputPath = str(sourcePath.resolve())
+        sourcePrefix = str(self.docSourcePath)
+        # swap just the leading source directory, not every match in the path
+        if outputPath == sourcePrefix or outputPath.startswith(sourcePrefix + os.sep):
+            outputPath = str(self.docGeneratedPath) + outputPath[len(sourcePrefix):]
         return pathlib.Path(outputPath)
 
 
@@ -85,31 +147,87 @@ class DocumentationWriter:
 
         outputDirectory.mkdir()
 
+# files in the doc source that StaticFileCopier does not copy
+_EXCLUDED_STATIC_SUFFIXES = ('.ipynb', '__pycache__', '.pyc', '.gitignore', 'conf.py', '.DS_Store')
+
+
+def _scanTree(rootPath):
+    '''
+    Yields an os.DirEntry for everything below rootPath (a str), depth-first
+    and sorted by name, so each directory comes just before its contents.
+
+    Uses os.scandir, whose entries carry the file type (and, on Windows, the
+    stat result) from the directory read itself.  Links to directories
+    are not followed.
+    '''
+    with os.scandir(rootPath) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scanTree(entry.path)
+
+
+def _copyFile(sourcePath, destinationPath):
+    '''
+    Copies the contents of sourcePath to destinationPath (both str) like
+    shutil.copyfile, but tries os.copy_file_range first, which lets the kernel
+    copy the data (or, on filesystems that can, share the blocks) in place.
+
+    shutil.copyfile, which already uses os.sendfile on Linux,
+    is the fallback wherever copy_file_range is missing or fails.
+    '''
+    copyFileRange = getattr(os, 'copy_file_range', None)  # Linux only
+    if copyFileRange is not None:
+        try:
+            with open(sourcePath, 'rb') as src, open(destinationPath, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copyFileRange(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(sourcePath, destinationPath)
+
+
 class StaticFileCopier(DocumentationWriter):
     '''
     Copies static files into the autogenerated directory.
     '''
     def run(self):
-        excludedFiles = ['.ipynb', '__pycache__', '.pyc', '.gitignore', 'conf.py', '.DS_Store']
-        for subPath in sorted(self.docSourcePath.rglob('*')):
-            if subPath.is_dir():
-                self.setupOutputDirectory(self.sourceToAutogenerated(subPath))
+        sourceRoot = str(self.docSourcePath)
+        generatedRoot = str(self.docGeneratedPath)
+        entries = list(_scanTree(sourceRoot))
+        # make all the output directories first, in one batch
+        for entry in entries:
+            if entry.is_dir():
+                os.makedirs(generatedRoot + entry.path[len(sourceRoot):], exist_ok=True)
+
+        for entry in entries:
+            if entry.is_dir():
                 continue
+            # entry.path always starts with sourceRoot, so just swap the prefix
+            outputFilePath = generatedRoot + entry.path[len(sourceRoot):]
 
-            runIt = True
-            for ex in excludedFiles:
-                if subPath.name.endswith(ex):
-                    runIt = False
-            if runIt is False:
+            if entry.name.endswith(_EXCLUDED_STATIC_SUFFIXES):
                 continue
 
-            outputFilePath = self.sourceToAutogenerated(subPath)
-            if (outputFilePath.exists()
-                    and outputFilePath.stat().st_mtime > subPath.stat().st_mtime):
-                print(f'\tSKIPPED {common.relativepath(outputFilePath)}')
+            sourceMTime = entry.stat().st_mtime_ns
+            try:
+                outputMTime = os.stat(outputFilePath).st_mtime_ns
+            except FileNotFoundError:
+                outputMTime = -1
+            # copies keep the mtime of their source, so equal means up to date
+            if outputMTime >= sourceMTime:
+                self.report(f'\tSKIPPED {common.relativepath(outputFilePath)}')
             else:
-                shutil.copyfile(str(subPath), str(outputFilePath))
-                print(f'\tWROTE   {common.relativepath(outputFilePath)}')
+                _copyFile(entry.path, outputFilePath)
+                os.utime(outputFilePath, ns=(sourceMTime, sourceMTime))
+                self.report(f'\tWROTE   {common.relativepath(outputFilePath)}')
 
 
 
@@ -122,32 +240,89 @@ class ReSTWriter(DocumentationWriter):
 
     def write(self, filePath, rst):
         '''
-        Write ``rst`` (a unicode string) to ``filePath``, a pathlib.Path()
+        Write ``rst`` (a unicode string, or the bytes of one already encoded
+        as utf-8) to ``filePath``, a pathlib.Path()
         only overwriting an existing file if the content differs.
+
+        Callers building rst from a list of lines should pass ``'\\n'.join(lines)``:
+        one encode of the joined string is much faster than encoding line by line.
+
+        A hash of the rst last written is kept next to the file (see
+        :meth:`hashFilePath`), so that unchanged output can usually be
+        skipped without reading the old file back in.
         '''
+        if isinstance(rst, bytes):
+            rstBytes = rst
+        else:
+            try:
+                rstBytes = rst.encode('utf-8')
+            except UnicodeEncodeError as uee:
+                raise DocumentationWritersException(
+                    f'Could not write {filePath} with rst:\n{rst}'
+                ) from uee
+        rstHash = hashlib.blake2b(rstBytes, digest_size=16).hexdigest()
+        hashFilePath = self.hashFilePath(filePath)
+
         shouldWrite = True
-        if filePath.exists():
-            oldRst = common.readFileEncodingSafe(filePath, firstGuess='utf-8')
-            if rst == oldRst:
+        try:
+            oldSize = filePath.stat().st_size
+        except FileNotFoundError:
+            oldSize = None
+        # a file of another size has changed, and need not be read at all.
+        if oldSize == len(rstBytes):
+            if self.readHash(hashFilePath) == rstHash:
                 shouldWrite = False
+            # rst is always written as utf-8, so compare the raw bytes
+            # rather than detecting the encoding and decoding the old file.
+            elif filePath.read_bytes() == rstBytes:
+                shouldWrite = False
+                self.writeHash(hashFilePath, rstHash)
             else:
                 pass
                 # # uncomment for  help in figuring out why a file keeps being different...
                 # import difflib
+                # oldRst = common.readFileEncodingSafe(filePath, firstGuess='utf-8')
                 # print(common.relativepath(filePath))
                 # print('\n'.join(difflib.ndiff(rst.split('\n'), oldRst.split('\n'))))
 
         if shouldWrite:
-            with filePath.open('w', encoding='utf-8') as f:
-                try:
-                    f.write(rst)
-                except UnicodeEncodeError as uee:
-                    raise DocumentationWritersException(
-                        f'Could not write {filePath} with rst:\n{rst}'
-                    ) from uee
-            print(f'\tWROTE   {common.relativepath(filePath)}')
+            filePath.write_bytes(rstBytes)
+            self.writeHash(hashFilePath, rstHash)
+            self.report(f'\tWROTE   {common.relativepath(filePath)}')
         else:
-            print(f'\tSKIPPED {common.relativepath(filePath)}')
+            self.report(f'\tSKIPPED {common.relativepath(filePath)}')
+
+    @staticmethod
+    def hashFilePath(filePath):
+        '''
+        Returns the path of the file holding the hash of the rst last
+        written to `filePath`.
+
+        >>> import pathlib
+        >>> ReSTWriter.hashFilePath(pathlib.Path('about', 'referenceCorpus.rst')).name
+        'referenceCorpus.rst.hash'
+        '''
+        return filePath.with_name(filePath.name + '.hash')
+
+    @staticmethod
+    def readHash(hashFilePath):
+        '''
+        Returns the hash stored in `hashFilePath`, or None if there is none.
+        '''
+        try:
+            return hashFilePath.read_text(encoding='ascii').strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def writeHash(hashFilePath, rstHash):
+        '''
+        Stores `rstHash` in `hashFilePath`, replacing the old file in one step
+        so that an interrupted build never leaves a partial hash behind.
+        '''
+        tempFilePath = hashFilePath.with_name(hashFilePath.name + '.tmp')
+        tempFilePath.write_text(rstHash, encoding='ascii')
+        os.replace(tempFilePath, hashFilePath)
 
 class ModuleReferenceReSTWriter(ReSTWriter):
     '''
@@ -161,22 +336,31 @@ class ModuleReferenceReSTWriter(ReSTWriter):
     def run(self):
         moduleReferenceDirectoryPath = self.outputDirectory
         referenceNames = []
-        for module in list(iterators.ModuleIterator()):
+        toWrite = []
+        for module in iterators.ModuleIterator():
             moduleDocumenter = documenters.ModuleDocumenter(module)
             if (not moduleDocumenter.classDocumenters
                     and not moduleDocumenter.functionDocumenters):
                 continue
-            rst = '\n'.join(moduleDocumenter.run())
             referenceName = moduleDocumenter.referenceName
             referenceNames.append(referenceName)
             fileName = f'{referenceName}.rst'
             rstFilePath = moduleReferenceDirectoryPath / fileName
+            toWrite.append((moduleDocumenter, rstFilePath))
 
+        def writeOne(documenterAndFilePath):
+            moduleDocumenter, rstFilePath = documenterAndFilePath
+            rst = '\n'.join(moduleDocumenter.run())
             try:
                 self.write(rstFilePath, rst)
             except TypeError as te:  # pragma: no cover
                 raise TypeError(f'File failed: {rstFilePath}, reason: {te}')
 
+        # each module is rendered and written on its own, so overlap the
+        # file reading and writing in threads; list() re-raises any error.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=common.cpus()) as executor:
+            list(executor.map(writeOne, toWrite))
+
         self.writeIndexRst(referenceNames)
 
     def writeIndexRst(self, referenceNames):
@@ -227,23 +411,81 @@ class IPythonNotebookReSTWriter(ReSTWriter):
     files.
 
     This class wraps the 3rd-party ``nbconvert`` Python script.
+
+    By default, works on every notebook found by
+    :class:`~documentation.docbuild.iterators.IPythonNotebookIterator`;
+    pass a list of pathlib.Path objects as `ipythonNotebookFilePaths`
+    to work on just those.
     '''
-    def __init__(self):
+    def __init__(self, ipythonNotebookFilePaths=None):
         from .iterators import IPythonNotebookIterator
         super().__init__()
-        self.ipythonNotebookFilePaths = list(IPythonNotebookIterator())
+        if ipythonNotebookFilePaths is None:
+            ipythonNotebookFilePaths = list(IPythonNotebookIterator())
+        self.ipythonNotebookFilePaths = ipythonNotebookFilePaths
         # Do not run self.setupOutputDirectory()
 
+    @property
+    def manifestFilePath(self):
+        '''
+        The JSON file recording, for each notebook, its modification time
+        (in nanoseconds) when it was last converted or found up to date.
+        It lives in the autogenerated directory, so cleaning the docs removes it.
+        '''
+        return self.docGeneratedPath / '.notebookMTimes.json'
+
+    def readManifest(self):
+        '''
+        Returns the dict stored in :attr:`manifestFilePath`, or an empty dict
+        if there is none (or it cannot be read).
+        '''
+        try:
+            with self.manifestFilePath.open('r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict):
+            return {}
+        return manifest
+
+    def writeManifest(self, manifest):
+        '''
+        Stores `manifest` in :attr:`manifestFilePath`, replacing the old file in one step.
+        '''
+        tempFilePath = self.manifestFilePath.with_name(self.manifestFilePath.name + '.tmp')
+        with tempFilePath.open('w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tempFilePath, self.manifestFilePath)
+
     def run(self):
-        for ipythonNotebookFilePath in self.ipythonNotebookFilePaths:
-            nbConvertReturnCode = self.convertOneNotebook(ipythonNotebookFilePath)
+        # notebooks not modified since the last build are skipped without
+        # reading their .rst files, as long as those files still exist.
+        manifest = self.readManifest()
+        currentMTimes = {str(fp): fp.stat().st_mtime_ns for fp in self.ipythonNotebookFilePaths}
+        changedFilePaths = [fp for fp in self.ipythonNotebookFilePaths
+                            if manifest.get(str(fp)) != currentMTimes[str(fp)]
+                            or not self.notebookFilePathToRstFilePath(fp).exists()]
+
+        # each notebook converts independently, so spread them over the cpus;
+        # the cleanup afterwards stays in this process.
+        nbConvertReturnCodes = common.runParallel(changedFilePaths, _convertOneNotebook)
+        wroteFilePaths = set()
+        for ipythonNotebookFilePath, nbConvertReturnCode in zip(changedFilePaths,
+                                                                nbConvertReturnCodes):
             if nbConvertReturnCode is True:
                 self.cleanupNotebookAssets(ipythonNotebookFilePath)
-                print(f'\tWROTE   {common.relativepath(ipythonNotebookFilePath)}')
+                wroteFilePaths.add(ipythonNotebookFilePath)
+
+        for ipythonNotebookFilePath in self.ipythonNotebookFilePaths:
+            if ipythonNotebookFilePath in wroteFilePaths:
+                self.report(f'\tWROTE   {common.relativepath(ipythonNotebookFilePath)}')
             else:
-                print(f'\tSKIPPED {common.relativepath(ipythonNotebookFilePath)}')
+                self.report(f'\tSKIPPED {common.relativepath(ipythonNotebookFilePath)}')
 
                 # do not print anything for skipped -checkpoint files
+        if changedFilePaths:
+            manifest.update((str(fp), currentMTimes[str(fp)]) for fp in changedFilePaths)
+            self.writeManifest(manifest)
         self.writeIndexRst()
 
     def writeIndexRst(self):
@@ -337,30 +579,47 @@ class IPythonNotebookReSTWriter(ReSTWriter):
         converts one .ipynb file to .rst using nbconvert.
 
         returns True if IPythonNotebook was converted.
-        returns False if IPythonNotebook's converted .rst file is newer than the .ipynb file.
+        returns False if IPythonNotebook has not changed since its .rst file was made.
+
+        Whether it has changed is decided by a hash of the notebook's contents,
+        stored next to the .rst file (see :meth:`notebookHashFilePath`), since
+        modification times are not kept by git checkouts.  An .rst file without
+        a stored hash is taken as current if it is newer than the notebook.
 
         sends AssertionError if ipythonNotebookFilePath does not exist.
         '''
         rstFilePath = self.notebookFilePathToRstFilePath(ipythonNotebookFilePath)
+        notebookHash = hashlib.blake2b(ipythonNotebookFilePath.read_bytes(),
+                                       digest_size=16).hexdigest()
+        hashFilePath = self.notebookHashFilePath(rstFilePath)
         if rstFilePath.exists():
-            # print(rstFilePath + ' exists')
-            # rst file is newer than .ipynb file, do not convert.
-
-            if rstFilePath.stat().st_mtime > ipythonNotebookFilePath.stat().st_mtime:
+            storedHash = self.readHash(hashFilePath)
+            if storedHash == notebookHash:
+                return False
+            # rst file made before notebook hashes were stored, and
+            # newer than .ipynb file: do not convert.
+            if (storedHash is None
+                    and rstFilePath.stat().st_mtime > ipythonNotebookFilePath.stat().st_mtime):
+                self.writeHash(hashFilePath, notebookHash)
                 return False
 
+        # the rst is cleaned up before nbconvert writes it, so it is written just once.
         self.runNBConvert(ipythonNotebookFilePath)
-        # uses this convoluted way of reading because 'encoding' was an invalid keyword argument
-        # for the built-in 'open' in old python, and never upgraded.
-        with rstFilePath.open('r', encoding='utf8') as f:
-            oldLines = f.read().splitlines()
-
-        lines = self.cleanConvertedNotebook(oldLines, ipythonNotebookFilePath)
-        with rstFilePath.open('w', encoding='utf8') as f:
-            f.write('\n'.join(lines))
-
+        self.writeHash(hashFilePath, notebookHash)
         return True
 
+    @staticmethod
+    def notebookHashFilePath(rstFilePath):
+        '''
+        Returns the path of the file holding the hash of the notebook
+        that `rstFilePath` was converted from.
+
+        >>> import pathlib
+        >>> IPythonNotebookReSTWriter.notebookHashFilePath(
+        ...     pathlib.Path('usersGuide', 'usersGuide_02_notes.rst')).name
+        'usersGuide_02_notes.rst.ipynb.hash'
+        '''
+        return rstFilePath.with_name(rstFilePath.name + '.ipynb.hash')
 
     def cleanConvertedNotebook(self, oldLines, ipythonNotebookFilePath):
         '''
@@ -371,52 +630,53 @@ class IPythonNotebookReSTWriter(ReSTWriter):
         notebookFileNameWithoutExtension = ipythonNotebookFilePath.stem
         # imageFileDirectoryName = self.sourceToAutogenerated(notebookFileNameWithoutExtension)
 
-        ipythonPromptPattern = re.compile(r'^In\[[\d ]+]:')
-        mangledInternalReference = re.compile(
-            r':(class|ref|func|meth|attr):``?(.*?)``?')
         newLines = [f'.. _{notebookFileNameWithoutExtension}:',
                     '']
         newLines += self.rstEditingWarningFormat
-        currentLineNumber = 0
 
-        while currentLineNumber < len(oldLines):
-            currentLine = oldLines[currentLineNumber]
+        imagePrefix = '.. image:: '
+        # ordinary lines only need their references fixed; collect runs of them
+        # and fix each run with one substitution over the joined text.
+        # (the pattern cannot match across a newline.)
+        plainLines = []
+
+        def flushPlainLines():
+            if plainLines:
+                # fix cases of inline :class:`~music21.stream.Stream` being
+                # converted by markdown to :class:``~music21.stream.Stream``
+                fixedText = _MANGLED_INTERNAL_REFERENCE.sub(r':\1:`\2`', '\n'.join(plainLines))
+                newLines.extend(fixedText.split('\n'))
+                plainLines.clear()
+
+        lineIterator = iter(oldLines)
+        for currentLine in lineIterator:
             # Remove all IPython prompts and the blank line that follows:
-            if ipythonPromptPattern.match(currentLine) is not None:
-                currentLineNumber += 2
-                continue
+            if _IPYTHON_PROMPT_PATTERN.match(currentLine) is not None:
+                next(lineIterator, None)
             # Correct the image path in each ReST image directive:
-            elif currentLine.startswith('.. image:: '):
-                imageFileName = currentLine.partition('.. image:: ')[2]
-                imageFileShort = imageFileName.split(os.path.sep)[-1]
+            elif currentLine.startswith(imagePrefix):
+                flushPlainLines()
                 if notebookFileNameWithoutExtension in currentLine:
-                    newImageDirective = f'.. image:: {imageFileShort}'
-                    newLines.append(newImageDirective)
+                    imageFileShort = currentLine[len(imagePrefix):].split(os.path.sep)[-1]
+                    newLines.append(imagePrefix + imageFileShort)
                 else:
                     newLines.append(currentLine)
-                currentLineNumber += 1
             elif '# ignore this' in currentLine:
+                flushPlainLines()
                 if '.. code:: ' in newLines[-2]:
-                    # print('STOP HERE!')
-                    newLines.pop()  # remove blank line
-                    newLines.pop()  # remove '.. code:: python'
+                    # remove '.. code:: python' and the blank line after it
+                    del newLines[-2:]
 
                 # compensate for:
                 # -- # ignore this
                 # -- %load_ext music21.ipython21.ipExtension
                 # by skipping two lines.
-                currentLineNumber += 2
+                next(lineIterator, None)
                 # TODO: Skip all % lines, without looking for '#ignore this'
             # Otherwise, nothing special to do, just add the line to our results:
             else:
-                # fix cases of inline :class:`~music21.stream.Stream` being
-                # converted by markdown to :class:``~music21.stream.Stream``
-                newCurrentLine = mangledInternalReference.sub(
-                    r':\1:`\2`',
-                    currentLine
-                )
-                newLines.append(newCurrentLine)
-                currentLineNumber += 1
+                plainLines.append(currentLine)
+        flushPlainLines()
 
         lines = self.blankLineAfterLiteral(newLines)
 
@@ -427,7 +687,7 @@ class IPythonNotebookReSTWriter(ReSTWriter):
         Guarantee a blank line after literal blocks.
         '''
         lines = [oldLines[0]]  # start with first line.
-        for first, second in windowed(oldLines, 2):
+        for first, second in zip(oldLines, oldLines[1:]):
             if (first.strip()
                     and first[0].isspace()
                     and second.strip()
@@ -455,9 +715,28 @@ class IPythonNotebookReSTWriter(ReSTWriter):
                              str(ipythonNotebookFilePath)])
         app.writer.build_directory = str(ipythonNotebookFilePath.parent)
         app.writer.log.addFilter(_BuildDirectoryFilter())
+
+        # initialize() makes a new writer each time, so wrapping its write method
+        # here only affects this conversion.
+        writeConverted = app.writer.write
+
+        def cleanAndWrite(output, resources, *args, **keywords):
+            lines = self.cleanConvertedNotebook(output.splitlines(), ipythonNotebookFilePath)
+            return writeConverted('\n'.join(lines), resources, *args, **keywords)
+
+        app.writer.write = cleanAndWrite
         app.start()
         return True
 
+def _convertOneNotebook(ipythonNotebookFilePath):
+    '''
+    Runs :meth:`IPythonNotebookReSTWriter.convertOneNotebook` on one notebook.
+    A module-level function so that it can be sent to
+    :func:`~music21.common.parallel.runParallel`.
+    '''
+    writer = IPythonNotebookReSTWriter([ipythonNotebookFilePath])
+    return writer.convertOneNotebook(ipythonNotebookFilePath)
+
 
 if __name__ == '__main__':
     i = IPythonNotebookReSTWriter()
@@ -20,7 +20,13 @@ users of 64-bit windows but 32-bit python should download the win32 port
 
 users of 64-bit windows and 64-bit python should download the amd64 port
 '''
-from importlib.util import find_spec
+import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
 import unittest
 import wave
 
@@ -30,6 +36,12 @@ from music21.common.types import DocOrder
 from music21 import environment
 environLocal = environment.Environment('audioSearch.recording')
 
+try:
+    # noinspection PyPackageRequirements
+    import pyaudio  # type: ignore  # pylint: disable=import-error
+except ImportError:  # pragma: no cover
+    pyaudio = None
+
 
 ###
 # to download pyaudio for windows 64-bit go to https://www.lfd.uci.edu/~gohlke/pythonlibs/
@@ -41,65 +53,467 @@ default_recordChannels = 1
 default_recordSampleRate = 44100
 default_recordChunkLength = 1024
 
+# chunk buffers kept by recordToFile; at the default chunk length about 0.75 seconds
+default_ringChunks = 32
+
+# how long a recording may run past its length before it is given up on, and how
+# often the stream is checked while waiting for it
+_recordingTimeoutMargin = 5.0
+_recordingPollInterval = 0.1
+
+# the most buffers POSIX guarantees a single writev call accepts
+_maxChunksPerWrite = 16
+
+
+def chunkLengthForSampleRate(recordSampleRate):
+    '''
+    Returns a chunk length in frames suited to recording at `recordSampleRate`:
+    the power of two closest to ten milliseconds of sound, long enough to avoid
+    overruns on slow devices and short enough to keep latency low.
+
+    >>> audioSearch.recording.chunkLengthForSampleRate(44100)
+    512
+    >>> audioSearch.recording.chunkLengthForSampleRate(48000)
+    512
+    >>> audioSearch.recording.chunkLengthForSampleRate(96000)
+    1024
+    >>> audioSearch.recording.chunkLengthForSampleRate(8000)
+    64
+    '''
+    return 2 ** max(0, round(math.log2(recordSampleRate / 100)))
+
 
 def samplesFromRecording(seconds=10.0, storeFile=True,
                          recordFormat=None,
                          recordChannels=default_recordChannels,
                          recordSampleRate=default_recordSampleRate,
-                         recordChunkLength=default_recordChunkLength):  # pragma: no cover
+                         recordChunkLength=default_recordChunkLength,
+                         *,
+                         inputDeviceIndex=None,
+                         hostApiStreamInfo=None,
+                         downcast=None,
+                         returnNumpy=False):  # pragma: no cover
     '''
     records `seconds` length of sound in the given format (default Wave)
     and optionally stores it to disk using the filename of `storeFile`
 
-    Returns a list of samples.
+    Sound is recorded from the system's default input device unless
+    `inputDeviceIndex` gives the PortAudio index of another one.  PyAudio
+    opens the device at its default low input latency; `hostApiStreamInfo`
+    can pass host-API-specific stream settings (such as PyAudio's
+    `PaMacCoreStreamInfo`) through to PortAudio for finer control.
+
+    If `recordChunkLength` is 0, a chunk length suited to `recordSampleRate` is
+    chosen with :func:`chunkLengthForSampleRate`.
+
+    If only the shape of the signal matters (as for pitch tracking), set
+    `downcast='int8'` to keep just the high byte of each 16-bit sample as it
+    arrives, halving the memory the recording takes.  The chunks then hold
+    signed 8-bit samples and any stored file is an 8-bit wave file.
+
+    If the input device delivers frames faster than they can be taken, PortAudio
+    drops the frames it could not deliver rather than stopping the recording;
+    the chunks stay in order but have gaps between them, and a warning gives
+    the number of overflows.
+
+    Returns a list of samples: one memoryview per chunk of `recordChunkLength`
+    frames, all of them slices of a single contiguous buffer.
+
+    If `returnNumpy` is True, the whole recording is instead returned as a
+    numpy array of shape (frames, `recordChannels`) over that same buffer,
+    without copying it, so that `array[:, 0]` is the first channel.
     '''
+    if pyaudio is None:
+        raise RecordingException('pyaudio must be installed to perform samplesFromRecording')
     # noinspection PyPackageRequirements
-    import pyaudio  # type: ignore  # pylint: disable=import-error
-    recordFormatDefault = pyaudio.paInt16
+    import numpy  # pylint: disable=import-error
 
     if recordFormat is None:
-        recordFormat = recordFormatDefault
+        recordFormat = pyaudio.paInt16
 
     if recordFormat == pyaudio.paInt8:
         raise RecordingException("cannot perform samplesFromRecording on 8-bit samples")
 
+    if downcast is None:
+        sampleWidth = pyaudio.get_sample_size(recordFormat)
+    elif downcast == 'int8':
+        if recordFormat != pyaudio.paInt16:
+            raise RecordingException("downcast='int8' requires 16-bit samples")
+        sampleWidth = 1
+    else:
+        raise RecordingException(f'cannot downcast samples to {downcast!r}')
+
+    if returnNumpy:
+        if downcast is not None:
+            sampleType = numpy.int8
+        else:
+            sampleType = {pyaudio.paInt16: '<i2',
+                          pyaudio.paInt32: '<i4',
+                          pyaudio.paFloat32: '<f4'}.get(recordFormat)
+            if sampleType is None:
+                raise RecordingException('cannot return this sample format as a numpy array')
+
+    if recordChunkLength == 0:
+        recordChunkLength = chunkLengthForSampleRate(recordSampleRate)
+    recordingLength = int(recordSampleRate * seconds) // recordChunkLength
+
+    chunkBytes = recordChunkLength * recordChannels * sampleWidth
+    fileBuffer = None
+    if storeFile is not False:
+        if isinstance(storeFile, str):
+            waveFilename = storeFile
+        else:
+            waveFilename = str(environLocal.getRootTempDir() / 'recordingTemp.wav')
+        # the final size of the file is known, so it is created at full size and
+        # mapped into memory: chunks are copied straight into the mapping and the
+        # operating system writes them back without any separate write calls.
+        fileBuffer = _mapWaveFile(waveFilename,
+                                  waveHeader(recordChannels,
+                                             sampleWidth,
+                                             recordSampleRate,
+                                             recordingLength * recordChunkLength),
+                                  recordingLength * chunkBytes)
+
+    # the size of the recording is known ahead of time, so one contiguous buffer
+    # is split up front into a fixed set of chunk-sized views, which serve as the
+    # only buffers samples are ever stored in.  When a file is stored, that buffer
+    # is the file's own mapping, which lasts as long as any of the views.
+    if fileBuffer is not None and downcast is None:
+        sampleBuffer = fileBuffer
+    else:
+        sampleBuffer = memoryview(bytearray(recordingLength * chunkBytes))
+    storedWaveSampleList = [sampleBuffer[i * chunkBytes:(i + 1) * chunkBytes]
+                            for i in range(recordingLength)]
+    fileChunks = None
+    if fileBuffer is not None and downcast is not None:
+        # 8-bit wave files hold unsigned samples, so they get their own copy
+        fileChunks = [numpy.frombuffer(fileBuffer[i * chunkBytes:(i + 1) * chunkBytes],
+                                       dtype=numpy.uint8)
+                      for i in range(recordingLength)]
+
+    # PortAudio calls this from its own thread, so acquisition does not depend on
+    # how promptly the Python side gets scheduled.  Each incoming chunk is copied
+    # into its preallocated view straight away so that PyAudio's own bytes object
+    # is released immediately.  The names used for every chunk are bound
+    # locally to spare a lookup per call.
+    finished = threading.Event()
+    callbackErrors = []
+    continueRecording = (None, pyaudio.paContinue)
+    paInputOverflow = pyaudio.paInputOverflow
+    chunksRecorded = 0
+    # an input overflow never interrupts the recording: PortAudio drops the frames
+    # it could not deliver and carries on, and the overflows are only counted.
+    overflowCount = 0
+
+    def recordCallback(in_data, unused_frame_count, unused_time_info, status):
+        nonlocal chunksRecorded, overflowCount
+        if status & paInputOverflow:
+            overflowCount += 1
+        if chunksRecorded >= recordingLength:
+            finished.set()
+            return (None, pyaudio.paComplete)
+        data = storedWaveSampleList[chunksRecorded]
+        if downcast is None:
+            data[:] = in_data
+        else:
+            samples = numpy.frombuffer(data, dtype=numpy.int8)
+            samples[:] = numpy.frombuffer(in_data, dtype='<i2') >> 8
+            if fileChunks is not None:
+                # flipping the sign bit converts signed samples to unsigned ones
+                numpy.bitwise_xor(samples.view(numpy.uint8), 0x80,
+                                  out=fileChunks[chunksRecorded])
+        chunksRecorded += 1
+        if chunksRecorded == recordingLength:
+            finished.set()
+            return (None, pyaudio.paComplete)
+        return continueRecording
+
+    p_audio, st = _openInputStream(_guardCallback(recordCallback, finished, callbackErrors),
+                                   recordFormat=recordFormat,
+                                   recordChannels=recordChannels,
+                                   recordSampleRate=recordSampleRate,
+                                   recordChunkLength=recordChunkLength,
+                                   inputDeviceIndex=inputDeviceIndex,
+                                   hostApiStreamInfo=hostApiStreamInfo)
+    _runInputStream(p_audio, st, finished, callbackErrors, seconds)
+
+    if overflowCount:
+        environLocal.warn(f'{overflowCount} input overflows during recording; '
+                          + 'some frames were dropped')
+
+    if returnNumpy:
+        return numpy.frombuffer(sampleBuffer, dtype=sampleType).reshape(-1, recordChannels)
+    return storedWaveSampleList
+
+
+def recordToFile(waveFilename,
+                 seconds=10.0,
+                 *,
+                 recordFormat=None,
+                 recordChannels=default_recordChannels,
+                 recordSampleRate=default_recordSampleRate,
+                 recordChunkLength=default_recordChunkLength,
+                 inputDeviceIndex=None,
+                 hostApiStreamInfo=None,
+                 ringChunks=default_ringChunks):  # pragma: no cover
+    '''
+    records `seconds` length of sound straight to the wave file `waveFilename`
+    without keeping the recording in memory, so that recordings of any length
+    can be made.
+
+    Chunks pass through a ring of `ringChunks` preallocated chunk buffers on
+    their way to disk: the recording callback fills a free buffer and a writer
+    thread hands it back once it has been written out.  Memory use therefore
+    depends only on `ringChunks` and `recordChunkLength`, not on `seconds`.
+    If the disk falls so far behind that no buffer is free, the chunk is
+    dropped, the written file is shortened to match, and a warning is given.
+
+    The other arguments are as in :func:`samplesFromRecording`.
+
+    Returns `waveFilename`.
+    '''
+    if pyaudio is None:
+        raise RecordingException('pyaudio must be installed to perform recordToFile')
+
+    if recordFormat is None:
+        recordFormat = pyaudio.paInt16
+    if recordFormat == pyaudio.paInt8:
+        raise RecordingException("cannot perform recordToFile on 8-bit samples")
+    sampleWidth = pyaudio.get_sample_size(recordFormat)
+
+    if recordChunkLength == 0:
+        recordChunkLength = chunkLengthForSampleRate(recordSampleRate)
+    recordingLength = int(recordSampleRate * seconds) // recordChunkLength
+
+    waveFd = _openWaveFile(waveFilename)
+    os.write(waveFd, waveHeader(recordChannels,
+                                sampleWidth,
+                                recordSampleRate,
+                                recordingLength * recordChunkLength))
+
+    chunkBytes = recordChunkLength * recordChannels * sampleWidth
+    ringBuffer = memoryview(bytearray(ringChunks * chunkBytes))
+    freeQueue = queue.Queue()
+    for i in range(ringChunks):
+        freeQueue.put(ringBuffer[i * chunkBytes:(i + 1) * chunkBytes])
+    writeQueue = queue.Queue()
+    writerThread = threading.Thread(target=_writeQueuedChunks,
+                                    args=(writeQueue, waveFd, freeQueue))
+    writerThread.start()
+
+    finished = threading.Event()
+    callbackErrors = []
+    continueRecording = (None, pyaudio.paContinue)
+    chunksRecorded = 0
+    chunksDropped = 0
+
+    def recordCallback(in_data, unused_frame_count, unused_time_info, unused_status):
+        nonlocal chunksRecorded, chunksDropped
+        if chunksRecorded >= recordingLength:
+            finished.set()
+            return (None, pyaudio.paComplete)
+        chunksRecorded += 1
+        try:
+            data = freeQueue.get_nowait()
+        except queue.Empty:
+            chunksDropped += 1
+        else:
+            data[:] = in_data
+            writeQueue.put(data)
+        if chunksRecorded == recordingLength:
+            finished.set()
+            return (None, pyaudio.paComplete)
+        return continueRecording
+
+    try:
+        p_audio, st = _openInputStream(_guardCallback(recordCallback, finished, callbackErrors),
+                                       recordFormat=recordFormat,
+                                       recordChannels=recordChannels,
+                                       recordSampleRate=recordSampleRate,
+                                       recordChunkLength=recordChunkLength,
+                                       inputDeviceIndex=inputDeviceIndex,
+                                       hostApiStreamInfo=hostApiStreamInfo)
+        _runInputStream(p_audio, st, finished, callbackErrors, seconds)
+    except BaseException:
+        writeQueue.put(None)
+        writerThread.join()
+        os.close(waveFd)
+        raise
+
+    writeQueue.put(None)
+    writerThread.join()
+    if chunksDropped:
+        environLocal.warn(f'{chunksDropped} chunks dropped while writing {waveFilename}')
+        os.lseek(waveFd, 0, os.SEEK_SET)
+        os.write(waveFd, waveHeader(recordChannels,
+                                    sampleWidth,
+                                    recordSampleRate,
+                                    (recordingLength - chunksDropped) * recordChunkLength))
+    os.close(waveFd)
+    return waveFilename
+
+
+def _openInputStream(callback, *,
+                     recordFormat,
+                     recordChannels,
+                     recordSampleRate,
+                     recordChunkLength,
+                     inputDeviceIndex,
+                     hostApiStreamInfo):  # pragma: no cover
+    '''
+    opens a stopped PyAudio input stream that passes each chunk of
+    `recordChunkLength` frames to `callback`, and returns it along with
+    the PyAudio instance it belongs to.
+    '''
     p_audio = pyaudio.PyAudio()
+    if inputDeviceIndex is None:
+        inputDeviceIndex = p_audio.get_default_input_device_info()['index']
     st = p_audio.open(format=recordFormat,
                       channels=recordChannels,
                       rate=recordSampleRate,
                       input=True,
-                      frames_per_buffer=recordChunkLength)
+                      input_device_index=inputDeviceIndex,
+                      input_host_api_specific_stream_info=hostApiStreamInfo,
+                      frames_per_buffer=recordChunkLength,
+                      start=False,
+                      stream_callback=callback)
+    return p_audio, st
 
-    recordingLength = int(recordSampleRate * float(seconds) / recordChunkLength)
 
-    storedWaveSampleList = []
+def _guardCallback(callback, finished, callbackErrors):
+    '''
+    wraps the stream callback `callback` so that an exception raised in it is
+    kept in `callbackErrors` and ends the recording.  Otherwise PortAudio would
+    only abort the stream, and the exception would be lost on its thread.
+    '''
+    def guardedCallback(in_data, frame_count, time_info, status):
+        try:
+            return callback(in_data, frame_count, time_info, status)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            callbackErrors.append(e)
+            finished.set()
+            return (None, pyaudio.paAbort)
+    return guardedCallback
 
-    # time_start = time.time()
-    for i in range(recordingLength):
-        data = st.read(recordChunkLength)
-        storedWaveSampleList.append(data)
-    # print('Time elapsed: %.3f s\n' % (time.time() - time_start))
-    st.close()
-    p_audio.terminate()
 
-    if storeFile is not False:
-        if isinstance(storeFile, str):
-            waveFilename = storeFile
-        else:
-            waveFilename = str(environLocal.getRootTempDir() / 'recordingTemp.wav')
-        # write recording to disk
-        data = b''.join(storedWaveSampleList)
-        try:
-            # wave.open does not take a path-like object as of 3.9
-            wf = wave.open(waveFilename, 'wb')
-            wf.setnchannels(recordChannels)
-            wf.setsampwidth(p_audio.get_sample_size(recordFormat))
-            wf.setframerate(recordSampleRate)
-            wf.writeframes(data)
-            wf.close()
-        except IOError:
-            raise RecordingException(f"Cannot open {waveFilename} for writing.")
-    return storedWaveSampleList
+def _runInputStream(p_audio, st, finished, callbackErrors, seconds):
+    '''
+    starts the input stream `st`, waits until its callback sets `finished`,
+    and then closes the stream and terminates `p_audio`.
+
+    Raises a RecordingException if the callback raised an exception (which is
+    in `callbackErrors`), or if the stream stops or the recording runs well
+    past `seconds` before `finished` is set.
+    '''
+    deadline = time.monotonic() + seconds + _recordingTimeoutMargin
+    try:
+        st.start_stream()
+        while not finished.wait(_recordingPollInterval):
+            if not st.is_active() or time.monotonic() > deadline:
+                break
+    finally:
+        st.stop_stream()
+        st.close()
+        p_audio.terminate()
+
+    if callbackErrors:
+        raise RecordingException(
+            f'recording failed: {callbackErrors[0]!r}') from callbackErrors[0]
+    if not finished.is_set():
+        raise RecordingException('recording stopped before it was complete')
+
+
+def _openWaveFile(waveFilename):
+    '''
+    opens `waveFilename` for writing, replacing any existing file, and
+    returns its file descriptor.
+    '''
+    try:
+        return os.open(waveFilename,
+                       os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+    except OSError:
+        raise RecordingException(f"Cannot open {waveFilename} for writing.")
+
+
+def _mapWaveFile(waveFilename, header, dataLength):
+    '''
+    creates `waveFilename` with room for `header` followed by `dataLength` bytes
+    of frames, maps it into memory, and returns a writable memoryview onto
+    the frames.
+
+    The file stays mapped for as long as the memoryview, or any slice of it,
+    is referenced.
+    '''
+    fd = _openWaveFile(waveFilename)
+    try:
+        os.ftruncate(fd, len(header) + dataLength)
+        mappedFile = mmap.mmap(fd, len(header) + dataLength)
+    except OSError:
+        raise RecordingException(f"Cannot open {waveFilename} for writing.")
+    finally:
+        os.close(fd)
+    mappedFile[:len(header)] = header
+    return memoryview(mappedFile)[len(header):]
+
+
+def waveHeader(channels, sampleWidth, frameRate, nFrames):
+    '''
+    Returns the 44-byte header of a PCM wave file holding `nFrames` frames
+    of `channels` channels of `sampleWidth`-byte samples at `frameRate`.
+
+    >>> header = audioSearch.recording.waveHeader(1, 2, 44100, 1024)
+    >>> len(header)
+    44
+    >>> header[:4], header[8:16], header[36:40]
+    (b'RIFF', b'WAVEfmt ', b'data')
+    '''
+    dataLength = nFrames * channels * sampleWidth
+    return struct.pack('<4sI4s4sIHHIIHH4sI',
+                       b'RIFF', 36 + dataLength, b'WAVE',
+                       b'fmt ', 16, 1, channels, frameRate,
+                       frameRate * channels * sampleWidth, channels * sampleWidth,
+                       sampleWidth * 8,
+                       b'data', dataLength)
+
+
+def _writeAll(fd, data):
+    '''
+    writes all of the bytes-like `data` to the file descriptor `fd`.
+    '''
+    data = memoryview(data).cast('B')
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _writeQueuedChunks(writeQueue, fd, releaseQueue=None):
+    '''
+    writes chunks of frames from `writeQueue` to the file descriptor `fd`
+    until a chunk of None is received.  If `releaseQueue` is given, each chunk
+    is put on it once written, so that its buffer can be reused.
+
+    Whatever chunks have queued up since the last write go out together,
+    in a single `os.writev` call on platforms that have it.
+    '''
+    finished = False
+    while not finished:
+        chunks = [writeQueue.get()]
+        while not writeQueue.empty() and len(chunks) < _maxChunksPerWrite:
+            chunks.append(writeQueue.get())
+        if chunks[-1] is None:
+            chunks.pop()
+            finished = True
+        if not chunks:
+            continue
+        if hasattr(os, 'writev'):
+            written = os.writev(fd, chunks)
+            if written < sum(memoryview(c).nbytes for c in chunks):
+                _writeAll(fd, b''.join(chunks)[written:])
+        else:  # pragma: no cover
+            for c in chunks:
+                _writeAll(fd, c)
+        if releaseQueue is not None:
+            for c in chunks:
+                releaseQueue.put(c)
 
 
 class RecordingException(exceptions21.Music21Exception):
@@ -108,17 +522,90 @@ class RecordingException(exceptions21.Music21Exception):
 
 # -----------------------------------------
 class Test(unittest.TestCase):
-    pass
 
+    def testWriteQueuedChunks(self):
+        import tempfile
+
+        chunks = [bytes(range(i, i + 8)) for i in range(0, 80, 8)]
+        writeQueue = queue.Queue()
+        for c in chunks:
+            writeQueue.put(memoryview(c))
+        writeQueue.put(None)
+        releaseQueue = queue.Queue()
 
+        fd, fp = tempfile.mkstemp(suffix='.wav')
+        try:
+            os.write(fd, waveHeader(2, 2, 8000, 20))
+            _writeQueuedChunks(writeQueue, fd, releaseQueue)
+            os.close(fd)
+            self.assertEqual(releaseQueue.qsize(), len(chunks))
+            with wave.open(fp, 'rb') as wf:
+                self.assertEqual(wf.getparams()[:4], (2, 2, 8000, 20))
+                self.assertEqual(wf.readframes(20), b''.join(chunks))
+        finally:
+            os.remove(fp)
+
+    def testMapWaveFile(self):
+        import tempfile
+
+        fd, fp = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        try:
+            frames = _mapWaveFile(fp, waveHeader(1, 2, 8000, 4), 8)
+            frames[:] = bytes(range(8))
+            del frames
+            with wave.open(fp, 'rb') as wf:
+                self.assertEqual(wf.getparams()[:4], (1, 2, 8000, 4))
+                self.assertEqual(wf.readframes(4), bytes(range(8)))
+        finally:
+            os.remove(fp)
+
+    def testRunInputStreamStopsEarly(self):
+        class FakeStream:
+            def __init__(self, active):
+                self.active = active
+                self.closed = False
+
+            def start_stream(self):
+                pass
+
+            def is_active(self):
+                return self.active
+
+            def stop_stream(self):
+                self.active = False
+
+            def close(self):
+                self.closed = True
+
+        class FakePyAudio:
+            def terminate(self):
+                pass
+
+        # the callback raised, so PortAudio aborted the stream
+        st = FakeStream(active=False)
+        finished = threading.Event()
+        callbackErrors = [ValueError('short buffer')]
+        with self.assertRaisesRegex(RecordingException, 'short buffer'):
+            _runInputStream(FakePyAudio(), st, finished, callbackErrors, 1.0)
+        self.assertTrue(st.closed)
+
+        # the stream stopped without the callback finishing or failing
+        st = FakeStream(active=False)
+        with self.assertRaisesRegex(RecordingException, 'before it was complete'):
+            _runInputStream(FakePyAudio(), st, threading.Event(), [], 1.0)
+        self.assertTrue(st.closed)
+
+        # the callback finished the recording
+        st = FakeStream(active=True)
+        finished = threading.Event()
+        finished.set()
+        _runInputStream(FakePyAudio(), st, finished, [], 1.0)
+        self.assertTrue(st.closed)
 
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
-    loader = find_spec('pyaudio')
-    if loader is not None:  # pragma: no cover
-        pyaudio_installed = True
-    else:
-        pyaudio_installed = False
+    pyaudio_installed = pyaudio is not None
 
     @unittest.skipUnless(pyaudio_installed, 'pyaudio must be installed')
     def testRecording(self):
@@ -128,6 +615,16 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
         sampleList = samplesFromRecording(seconds=1, storeFile=False)
         print(sampleList[30:40])
 
+    @unittest.skipUnless(pyaudio_installed, 'pyaudio must be installed')
+    def testRecordToFile(self):
+        '''
+        record one second of data to a file and check its length
+        '''
+        waveFilename = str(environLocal.getRootTempDir() / 'recordingTemp.wav')
+        recordToFile(waveFilename, seconds=1)
+        with wave.open(waveFilename, 'rb') as wf:
+            print(wf.getnframes())
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
@@ -18,6 +18,8 @@ This module defines numerous subclasses of
 commonly used clefs. Clef objects are often found
 within :class:`~music21.stream.Measure` objects.
 '''
+import bisect
+from functools import lru_cache
 import unittest
 import typing as t
 
@@ -95,15 +97,24 @@ class Clef(base.Music21Object):
 
     _styleClass = style.TextStyle
     classSortOrder = 0
-
-    def __init__(self):
-        super().__init__()
-        self.sign: t.Optional[str] = None
-        # line counts start from the bottom up, the reverse of musedata
-        self.line: t.Optional[int] = None
-        self._octaveChange: int = 0  # set to zero as default
-        # musicxml has an attribute for clefOctaveChange,
-        # an integer to show transposing clef
+    # the value of .name, set once for each subclass from its class name
+    _name: str = ''
+
+    # defaults shared by all instances until set on one:
+    sign: t.Optional[str] = None
+    # line counts start from the bottom up, the reverse of musedata
+    line: t.Optional[int] = None
+    # musicxml has an attribute for clefOctaveChange,
+    # an integer to show transposing clef
+    _octaveChange: int = 0
+    # diatonicNoteNum of the middle line of the staff, for stem directions;
+    # clefs without a lowestLine assume TrebleClef-like.
+    _midLine: int = 35
+
+    def __init_subclass__(cls, **keywords):
+        super().__init_subclass__(**keywords)
+        className = cls.__name__.replace('Clef', '')
+        cls._name = className[:1].lower() + className[1:]
 
     def __eq__(self, other):
         '''
@@ -122,17 +133,24 @@ class Clef(base.Music21Object):
         >>> c4.octaveChange = -1
         >>> c3 == c4
         False
+        >>> c3 == 'treble'
+        False
         '''
-        try:
-            if (self.__class__ == other.__class__
-                    and self.sign == other.sign
-                    and self.line == other.line
-                    and self.octaveChange == other.octaveChange):
-                return True
-            else:
-                return False
-        except AttributeError:
+        if self is other:
+            return True
+        if type(self) is not type(other):
             return False
+        return ((self.sign, self.line, self._octaveChange)
+                == (other.sign, other.line, other._octaveChange))
+
+    def __hash__(self):
+        '''
+        Clefs that are equal have the same hash.
+
+        >>> hash(clef.TrebleClef()) == hash(clef.TrebleClef())
+        True
+        '''
+        return hash((type(self), self.sign, self.line, self._octaveChange))
 
     def _reprInternal(self):
         return ''
@@ -176,11 +194,7 @@ class Clef(base.Music21Object):
         >>> clef.Clef().name
         ''
         '''
-        className = self.__class__.__name__.replace('Clef', '')
-        if className:
-            return className[0].lower() + className[1:]
-        else:
-            return ''
+        return self._name
 
     def getStemDirectionForPitches(
         self,
@@ -232,29 +246,23 @@ class Clef(base.Music21Object):
             pitchList = [pitches]
         else:
             pitchList = pitches
-        relevantPitches: t.Sequence[pitch.Pitch]
+        relevantNoteNums: t.List[int]
 
         if not pitchList:
             raise ValueError('getStemDirectionForPitches cannot operate on an empty list')
 
         if extremePitchOnly:
-            pitchMin = min(pitchList, key=lambda pp: pp.diatonicNoteNum)
-            pitchMax = max(pitchList, key=lambda pp: pp.diatonicNoteNum)
-            relevantPitches = [pitchMin, pitchMax]
+            noteNums = [p.diatonicNoteNum for p in pitchList]
+            relevantNoteNums = [min(noteNums), max(noteNums)]
         elif firstLastOnly and len(pitchList) > 1:
-            relevantPitches = [pitchList[0], pitchList[-1]]
+            relevantNoteNums = [pitchList[0].diatonicNoteNum, pitchList[-1].diatonicNoteNum]
         else:
-            relevantPitches = pitchList
+            relevantNoteNums = [p.diatonicNoteNum for p in pitchList]
 
-        differenceSum = 0
-        if isinstance(self, (PercussionClef, PitchClef)) and self.lowestLine is not None:
-            midLine = self.lowestLine + 4
-        else:
-            midLine = 35  # assume TrebleClef-like.
+        midLine = self._midLine
 
-        for p in relevantPitches:
-            distanceFromMidLine = p.diatonicNoteNum - midLine
-            differenceSum += distanceFromMidLine
+        # the sum of the distances of each note from the middle line
+        differenceSum = sum(relevantNoteNums) - midLine * len(relevantNoteNums)
 
         if differenceSum >= 0:
             return 'down'
@@ -281,9 +289,13 @@ class PitchClef(Clef):
             ''',
     }
 
-    def __init__(self):
-        super().__init__()
-        self.lowestLine: int = 31
+    lowestLine: int = 31
+
+    @property
+    def _midLine(self) -> int:  # type: ignore[override]
+        if self.lowestLine is None:
+            return 35
+        return self.lowestLine + 4
 
     @property
     def octaveChange(self) -> int:
@@ -339,10 +351,10 @@ class PercussionClef(Clef):
     '''
     _DOC_ATTR: t.Dict[str, str] = {}
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'percussion'
-        self.lowestLine = (7 * 4) + 3  # 4 octaves + 3 notes = e4
+    sign = 'percussion'
+    lowestLine = (7 * 4) + 3  # 4 octaves + 3 notes = e4
+
+    _midLine = PitchClef._midLine
 
 
 class NoClef(Clef):
@@ -360,9 +372,7 @@ class NoClef(Clef):
     '''
     _DOC_ATTR: t.Dict[str, str] = {}
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'none'
+    sign = 'none'
 
 
 class JianpuClef(NoClef):
@@ -375,9 +385,7 @@ class JianpuClef(NoClef):
     'jianpu'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'jianpu'
+    sign = 'jianpu'
 
 
 class TabClef(PitchClef):
@@ -389,10 +397,8 @@ class TabClef(PitchClef):
     'TAB'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'TAB'
-        self.line = 5
+    sign = 'TAB'
+    line = 5
 
     def getStemDirectionForPitches(
         self,
@@ -423,9 +429,7 @@ class GClef(PitchClef):
     31
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'G'
+    sign = 'G'
 
 
 class FrenchViolinClef(GClef):
@@ -441,10 +445,8 @@ class FrenchViolinClef(GClef):
     1
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 1
-        self.lowestLine = (7 * 4) + 5
+    line = 1
+    lowestLine = (7 * 4) + 5
 
 
 class TrebleClef(GClef):
@@ -462,10 +464,8 @@ class TrebleClef(GClef):
     31
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 2
-        self.lowestLine = (7 * 4) + 3  # 4 octaves + 3 notes = e4
+    line = 2
+    lowestLine = (7 * 4) + 3  # 4 octaves + 3 notes = e4
 
 
 class Treble8vbClef(TrebleClef):
@@ -479,10 +479,8 @@ class Treble8vbClef(TrebleClef):
     -1
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.octaveChange = -1
-        self.lowestLine = (7 * 3) + 3
+    _octaveChange = -1
+    lowestLine = (7 * 3) + 3
 
 
 class Treble8vaClef(TrebleClef):
@@ -496,10 +494,8 @@ class Treble8vaClef(TrebleClef):
     1
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.octaveChange = 1
-        self.lowestLine = (7 * 3) + 3
+    _octaveChange = 1
+    lowestLine = (7 * 3) + 3
 
 
 class GSopranoClef(GClef):
@@ -514,10 +510,9 @@ class GSopranoClef(GClef):
     3
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 3
-        self.lowestLine = (7 * 4) + 1
+    line = 3
+    lowestLine = (7 * 4) + 1
+
 
 # ------------------------------------------------------------------------------
 
@@ -531,9 +526,7 @@ class CClef(PitchClef):
     'C'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'C'
+    sign = 'C'
 
 
 class SopranoClef(CClef):
@@ -548,10 +541,8 @@ class SopranoClef(CClef):
     1
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 1
-        self.lowestLine = (7 * 4) + 1
+    line = 1
+    lowestLine = (7 * 4) + 1
 
 
 class MezzoSopranoClef(CClef):
@@ -566,10 +557,8 @@ class MezzoSopranoClef(CClef):
     2
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 2
-        self.lowestLine = (7 * 3) + 6
+    line = 2
+    lowestLine = (7 * 3) + 6
 
 
 class AltoClef(CClef):
@@ -583,10 +572,8 @@ class AltoClef(CClef):
     3
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 3
-        self.lowestLine = (7 * 3) + 4
+    line = 3
+    lowestLine = (7 * 3) + 4
 
 
 class TenorClef(CClef):
@@ -602,10 +589,8 @@ class TenorClef(CClef):
 
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 4
-        self.lowestLine = (7 * 3) + 2
+    line = 4
+    lowestLine = (7 * 3) + 2
 
 
 class CBaritoneClef(CClef):
@@ -619,10 +604,8 @@ class CBaritoneClef(CClef):
     5
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 5
-        self.lowestLine = (7 * 2) + 7
+    line = 5
+    lowestLine = (7 * 2) + 7
 
 
 # ------------------------------------------------------------------------------
@@ -635,9 +618,7 @@ class FClef(PitchClef):
     'F'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.sign = 'F'
+    sign = 'F'
 
 
 class FBaritoneClef(FClef):
@@ -656,10 +637,8 @@ class FBaritoneClef(FClef):
     False
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 3
-        self.lowestLine = (7 * 2) + 7
+    line = 3
+    lowestLine = (7 * 2) + 7
 
 
 class BassClef(FClef):
@@ -671,10 +650,8 @@ class BassClef(FClef):
     'F'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 4
-        self.lowestLine = (7 * 2) + 5
+    line = 4
+    lowestLine = (7 * 2) + 5
 
 
 class Bass8vbClef(FClef):
@@ -688,11 +665,9 @@ class Bass8vbClef(FClef):
     -1
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 4
-        self.octaveChange = -1
-        self.lowestLine = (7 * 2) + 5
+    line = 4
+    _octaveChange = -1
+    lowestLine = (7 * 2) + 5
 
 
 class Bass8vaClef(FClef):
@@ -704,11 +679,9 @@ class Bass8vaClef(FClef):
     'F'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 4
-        self.octaveChange = 1
-        self.lowestLine = (7 * 2) + 5
+    line = 4
+    _octaveChange = 1
+    lowestLine = (7 * 2) + 5
 
 
 class SubBassClef(FClef):
@@ -720,10 +693,8 @@ class SubBassClef(FClef):
     'F'
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.line = 5
-        self.lowestLine = (7 * 2) + 3
+    line = 5
+    lowestLine = (7 * 2) + 3
 
 
 # ------------------------------------------------------------------------------
@@ -734,6 +705,44 @@ CLASS_FROM_TYPE: t.Dict[str, t.List[t.Optional[t.Type[Clef]]]] = {
     'TAB': [None, None, None, None, None, TabClef]
 }
 
+# the same, as one flat lookup by (sign, line), leaving out the gaps
+_CLASS_FROM_SIGN_AND_LINE: t.Dict[t.Tuple[str, int], t.Type[Clef]] = {
+    (sign, lineNum): clefClass
+    for sign, lineList in CLASS_FROM_TYPE.items()
+    for lineNum, clefClass in enumerate(lineList)
+    if clefClass is not None
+}
+
+# the class to use for a sign on a line that has no named clef
+_GENERIC_CLASS_FROM_SIGN: t.Dict[str, t.Type[Clef]] = {
+    'G': GClef,
+    'F': FClef,
+    'C': CClef,
+    'TAB': TabClef,
+}
+
+# transposing clefs, by (sign, line, octaveShift)
+_OCTAVE_SHIFT_CLASSES: t.Dict[t.Tuple[str, int, int], t.Type[Clef]] = {
+    ('G', 2, -1): Treble8vbClef,
+    ('G', 2, 1): Treble8vaClef,
+    ('F', 4, -1): Bass8vbClef,
+    ('F', 4, 1): Bass8vaClef,
+}
+
+# clefs that clefFromString reads from a word rather than a sign and a line
+_SPECIAL_CLASS_FROM_STRING: t.Dict[str, t.Type[Clef]] = {
+    'tab': TabClef,
+    'percussion': PercussionClef,
+    'none': NoClef,
+    'jianpu': JianpuClef,
+}
+
+# every Clef class in this module, by its lowercased name, for clefFromString
+_CLEF_CLASSES_BY_NAME: t.Dict[str, t.Type[Clef]] = {
+    name.lower(): obj for name, obj in list(globals().items())
+    if isinstance(obj, type) and issubclass(obj, Clef)
+}
+
 
 def clefFromString(clefString, octaveShift=0) -> Clef:
     '''
@@ -800,19 +809,48 @@ def clefFromString(clefString, octaveShift=0) -> Clef:
     >>> clef.clefFromString('treble8vb')
     <music21.clef.Treble8vbClef>
     '''
+    clefClass, attributes = _clefSpecFromString(clefString, octaveShift)
+    clefObj = clefClass()
+    for attribute, value in attributes:
+        setattr(clefObj, attribute, value)
+    return clefObj
+
+
+@lru_cache(256)
+def _clefSpecFromString(
+    clefString: str,
+    octaveShift: int = 0
+) -> t.Tuple[t.Type[Clef], t.Tuple[t.Tuple[str, t.Any], ...]]:
+    '''
+    Does the parsing for :func:`clefFromString`: returns the Clef class to
+    create for `clefString` and `octaveShift`, along with a tuple of
+    (attribute, value) pairs to set on the new object.
+
+    The result is cached, since the same few strings are read over and over
+    in parsing a score, while each call to `clefFromString` must still return
+    a new Clef.
+
+    >>> clef._clefSpecFromString('G2')
+    (<class 'music21.clef.TrebleClef'>, ())
+    >>> clef._clefSpecFromString('F1')
+    (<class 'music21.clef.FClef'>, (('line', 1),))
+    >>> clef._clefSpecFromString('C3', 1)
+    (<class 'music21.clef.AltoClef'>, (('octaveChange', 1),))
+    '''
     xnStr = clefString.strip()
-    if xnStr.lower() in ('tab', 'percussion', 'none', 'jianpu'):
-        if xnStr.lower() == 'tab':
-            return TabClef()
-        elif xnStr.lower() == 'percussion':
-            return PercussionClef()
-        elif xnStr.lower() == 'none':
-            return NoClef()
-        elif xnStr.lower() == 'jianpu':
-            return JianpuClef()
+    xnLower = xnStr.lower()
+    specialClass = _SPECIAL_CLASS_FROM_STRING.get(xnLower)
+    if specialClass is not None:
+        return specialClass, ()
 
     if len(xnStr) == 2:
-        (thisType, lineNum) = (xnStr[0].upper(), int(xnStr[1]))
+        thisType = xnStr[0].upper()
+        lineChar = xnStr[1]
+        if '1' <= lineChar <= '5':
+            lineNum = ord(lineChar) - 48  # ord('0') == 48
+        else:
+            # other digits get the line-number error below; non-digits raise ValueError
+            lineNum = int(lineChar)
     elif len(xnStr) == 1:  # some Humdrum files have just ClefG, eg. Haydn op. 9 no 3, mvmt 1
         thisType = xnStr[0].upper()
         if thisType == 'G':
@@ -824,31 +862,19 @@ def clefFromString(clefString, octaveShift=0) -> Clef:
         else:
             lineNum = False
     elif len(xnStr) > 2:
-        from music21 import clef as myself
-        xnLower = xnStr.lower()
-        for x in dir(myself):
-            if 'Clef' not in x:
-                continue
-            if xnLower != x.lower() and xnLower + 'clef' != x.lower():
-                continue
-            objType = getattr(myself, x)
-            if isinstance(objType, type):
-                return objType()
+        objType = (_CLEF_CLASSES_BY_NAME.get(xnLower)
+                   or _CLEF_CLASSES_BY_NAME.get(xnLower + 'clef'))
+        if objType is not None:
+            return objType, ()
 
         raise ClefException('Could not find clef ' + xnStr)
     else:
         raise ClefException('Entry has clef info but no clef specified')
 
     if octaveShift != 0:
-        params = (thisType, lineNum, octaveShift)
-        if params == ('G', 2, -1):
-            return Treble8vbClef()
-        elif params == ('G', 2, 1):
-            return Treble8vaClef()
-        elif params == ('F', 4, -1):
-            return Bass8vbClef()
-        elif params == ('F', 4, 1):
-            return Bass8vaClef()
+        octaveClass = _OCTAVE_SHIFT_CLASSES.get((thisType, lineNum, octaveShift))
+        if octaveClass is not None:
+            return octaveClass, ()
         # other octaveShifts will pass through
 
     if thisType is False or lineNum is False:
@@ -858,37 +884,36 @@ def clefFromString(clefString, octaveShift=0) -> Clef:
         raise ClefException('line number (second character) must be 1-5; do not use this '
                             + f"function for clefs on special staves such as {xnStr!r}")
 
-    clefObj: Clef
-    if thisType in CLASS_FROM_TYPE:
-        line_list = CLASS_FROM_TYPE[thisType]
-        assert isinstance(line_list, list)
-        if line_list[lineNum] is None:
-            if thisType == 'G':
-                clefObj = GClef()
-            elif thisType == 'F':
-                clefObj = FClef()
-            elif thisType == 'C':
-                clefObj = CClef()
-            elif thisType == 'TAB':
-                clefObj = TabClef()
-            else:  # pragma: no cover
-                clefObj = PitchClef()
-            clefObj.line = lineNum
-        else:
-            ClefType = line_list[lineNum]
-            if t.TYPE_CHECKING:
-                assert ClefType is not None
-                assert issubclass(ClefType, PitchClef)
-            clefObj = ClefType()
-    else:
-        clefObj = PitchClef()
-        clefObj.sign = thisType
-        clefObj.line = lineNum
+    attributes: t.List[t.Tuple[str, t.Any]] = []
+    clefClass = _CLASS_FROM_SIGN_AND_LINE.get((thisType, lineNum))
+    if clefClass is None:
+        clefClass = _GENERIC_CLASS_FROM_SIGN.get(thisType)
+        if clefClass is None:
+            clefClass = PitchClef
+            attributes.append(('sign', thisType))
+        attributes.append(('line', lineNum))
 
     if octaveShift != 0:
-        clefObj.octaveChange = octaveShift
+        attributes.append(('octaveChange', octaveShift))
 
-    return clefObj
+    return clefClass, tuple(attributes)
+
+
+def _iterDiatonicNoteNums(notes) -> t.Iterator[int]:
+    '''
+    yields the diatonicNoteNum of every pitch of the notes and chords in
+    `notes`, skipping rests.
+
+    >>> s = stream.Stream([note.Note('C4'), note.Rest(), chord.Chord('E4 G4')])
+    >>> list(clef._iterDiatonicNoteNums(s.notesAndRests))
+    [29, 31, 33]
+    '''
+    for n in notes:
+        if n.isNote:
+            yield n.pitch.diatonicNoteNum
+        elif n.isChord:
+            for p in n.pitches:
+                yield p.diatonicNoteNum
 
 
 def bestClef(streamObj: 'music21.stream.Stream',
@@ -955,50 +980,76 @@ def bestClef(streamObj: 'music21.stream.Stream',
     >>> clef.bestClef(stream.Stream([note.Note('C0')]))
     <music21.clef.Bass8vbClef>
     '''
-    def findHeight(pInner):
-        height = pInner.diatonicNoteNum
-        if pInner.diatonicNoteNum > 33:  # a4
-            height += 3  # bonus
-        elif pInner.diatonicNoteNum < 24:  # Bass F or lower
-            height += -3  # bonus
-        return height
+    def findHeight(diatonicNoteNum):
+        # bonus of 3 above a4, and of -3 at Bass F or lower
+        return diatonicNoteNum + 3 * (diatonicNoteNum > 33) - 3 * (diatonicNoteNum < 24)
     # environLocal.printDebug(['calling bestClef()'])
 
-    totalNotes = 0
-    totalHeight = 0
-
     sIter = streamObj.recurse() if recurse else streamObj.iter()
 
     notes = sIter.notesAndRests
 
-    for n in notes:
-        if n.isRest:
-            pass
-        elif n.isNote:
-            totalNotes += 1
-            totalHeight += findHeight(n.pitch)
-        elif n.isChord:
-            for p in n.pitches:
-                totalNotes += 1
-                totalHeight += findHeight(p)
+    diatonicNoteNums = list(_iterDiatonicNoteNums(notes))
+
+    totalNotes = len(diatonicNoteNums)
+    if totalNotes >= 32 and 'numpy' not in base._missingImport:
+        # for larger streams, add up all the heights in one pass over an array
+        import numpy
+        noteNumArray = numpy.array(diatonicNoteNums, dtype=numpy.int16)
+        totalHeight = (int(noteNumArray.sum())
+                       + 3 * numpy.count_nonzero(noteNumArray > 33)
+                       - 3 * numpy.count_nonzero(noteNumArray < 24))
+    else:
+        totalHeight = sum(map(findHeight, diatonicNoteNums))
+
+    return _bestClefFromHeights(totalHeight, totalNotes, allowTreble8vb)
+
+
+# (sorted average-height thresholds, clef class chosen for each band);
+# values found with experimentation; revise.  28 is c4.
+_BEST_CLEF_THRESHOLDS: t.Tuple[t.Tuple[int, ...], t.Tuple[t.Type[PitchClef], ...]] = (
+    (10, 28, 49),
+    (Bass8vbClef, BassClef, TrebleClef, Treble8vaClef),
+)
+_BEST_CLEF_THRESHOLDS_8VB: t.Tuple[t.Tuple[int, ...], t.Tuple[t.Type[PitchClef], ...]] = (
+    (10, 26, 32, 49),
+    (Bass8vbClef, BassClef, Treble8vbClef, TrebleClef, Treble8vaClef),
+)
+
+
+def _bestClefFromHeights(totalHeight: int,
+                         totalNotes: int,
+                         allowTreble8vb=False) -> PitchClef:
+    '''
+    The decision part of :func:`bestClef`: given the sum of the (weighted)
+    heights of `totalNotes` notes, return the best clef.  Callers that have
+    already walked their notes can call this directly instead of having
+    bestClef traverse the stream again.
+
+    >>> clef._bestClefFromHeights(35 * 4, 4)
+    <music21.clef.TrebleClef>
+    >>> clef._bestClefFromHeights(22 * 4, 4)
+    <music21.clef.BassClef>
+    >>> clef._bestClefFromHeights(30, 1, allowTreble8vb=True)
+    <music21.clef.Treble8vbClef>
+
+    With no notes, the average height is taken to be 29 (just above middle C):
+
+    >>> clef._bestClefFromHeights(0, 0)
+    <music21.clef.TrebleClef>
+    '''
     if totalNotes == 0:
         averageHeight = 29.0
     else:
         averageHeight = totalHeight / totalNotes
 
     # environLocal.printDebug(['average height', averageHeight])
-    if averageHeight > 49:  # value found with experimentation; revise
-        return Treble8vaClef()
-    elif allowTreble8vb and averageHeight > 32:
-        return TrebleClef()
-    elif not allowTreble8vb and averageHeight > 28:  # c4
-        return TrebleClef()
-    elif allowTreble8vb and averageHeight > 26:
-        return Treble8vbClef()
-    elif averageHeight > 10:  # value found with experimentation; revise
-        return BassClef()
+    if allowTreble8vb:
+        thresholds, clefClasses = _BEST_CLEF_THRESHOLDS_8VB
     else:
-        return Bass8vbClef()
+        thresholds, clefClasses = _BEST_CLEF_THRESHOLDS
+    # a clef is chosen when the average height is strictly above its threshold
+    return clefClasses[bisect.bisect_left(thresholds, averageHeight)]()
 
 
 # ------------------------------------------------------------------------------
@@ -1006,27 +1057,13 @@ class Test(unittest.TestCase):
 
     def testCopyAndDeepcopy(self):
         '''
-        Test copying all objects defined in this module
+        Test copying all Clef classes defined in this module
         '''
         import copy
-        import sys
-        import types
-        for part in sys.modules[self.__module__].__dict__:
-            match = False
-            for skip in ['_', '__', 'Test', 'Exception']:
-                if part.startswith(skip) or part.endswith(skip):
-                    match = True
-            if match:
-                continue
-            name = getattr(sys.modules[self.__module__], part)
-            # noinspection PyTypeChecker
-            if callable(name) and not isinstance(name, types.FunctionType):
-                try:  # see if obj can be made w/ args
-                    obj = name()
-                except TypeError:
-                    continue
-                unused_a = copy.copy(obj)
-                unused_b = copy.deepcopy(obj)
+        for clefClass in _CLEF_CLASSES_BY_NAME.values():
+            obj = clefClass()
+            self.assertEqual(copy.copy(obj), obj)
+            self.assertEqual(copy.deepcopy(obj), obj)
 
     def testConversionClassMatch(self):
         from xml.etree.ElementTree import fromstring as El
@@ -24,6 +24,8 @@ For instance, TextExpressions.
 #     create interval.Interval objects only when necessary.
 
 import copy
+from functools import lru_cache, partial
+import re
 import string
 import unittest
 import typing as t
@@ -37,6 +39,9 @@ from music21 import style
 
 _MOD = 'expressions'
 
+_ROMAN_NUMERAL_PATTERN = re.compile(r'[IVXLCDM]+', re.IGNORECASE)
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
 
 def realizeOrnaments(srcObject):
     '''
@@ -65,40 +70,202 @@ def realizeOrnaments(srcObject):
         preExpandList = []
         postExpandList = []
 
-        loopBuster = 100
-        while loopBuster:
-            loopBuster -= 1
-            thisExpression = srcObject.expressions[0]
-            if hasattr(thisExpression, 'realize'):
-                preExpand, newSrcObject, postExpand = thisExpression.realize(srcObject)
-                for i in preExpand:
-                    preExpandList.append(i)
-                for i in postExpand:
-                    postExpandList.append(i)
-                if newSrcObject is None:
-                    # some ornaments eat up the entire source object. Trills for instance
-                    srcObject = newSrcObject
-                    break
-                newSrcObject.expressions = srcObject.expressions[1:]
-                srcObject = newSrcObject
-                if not srcObject.expressions:
-                    break
-            else:  # cannot realize this object
-                srcObject.expressions = srcObject.expressions[1:]
-                if not srcObject.expressions:
-                    break
-
-        retList = []
-        # TODO: use extend...
-        for i in preExpandList:
-            retList.append(i)
+        # expressions[:start] have been passed over as unrealizable; the list
+        # is only sliced when they are actually dropped from srcObject.
+        # Each pass either advances start or moves on to a new srcObject with
+        # one expression fewer, so the loop always ends.
+        expressionList = srcObject.expressions
+        start = 0
+        while start < len(expressionList):
+            thisExpression = expressionList[start]
+            if not hasattr(thisExpression, 'realize'):
+                start += 1  # cannot realize this object
+                continue
+
+            if start:
+                srcObject.expressions = expressionList[start:]
+            preExpand, newSrcObject, postExpand = thisExpression.realize(srcObject)
+            preExpandList.extend(preExpand)
+            postExpandList.extend(postExpand)
+            if newSrcObject is None:
+                # some ornaments eat up the entire source object. Trills for instance
+                srcObject = None
+                break
+            newSrcObject.expressions = expressionList[start + 1:]
+            srcObject = newSrcObject
+            expressionList = srcObject.expressions
+            start = 0
+
+        if srcObject is not None and start:
+            srcObject.expressions = expressionList[start:]
+
+        retList = preExpandList
         if srcObject is not None:
             retList.append(srcObject)
-        for i in postExpandList:
-            retList.append(i)
+        retList.extend(postExpandList)
         return retList
 
 
+@lru_cache(128)
+def _nameFromClassName(className: str) -> str:
+    '''
+    Cached conversion of an Expression class name to its `.name`.
+
+    >>> expressions._nameFromClassName('InvertedTurn')
+    'inverted turn'
+    '''
+    return common.camelCaseToHyphen(className, replacement=' ')
+
+
+@lru_cache(256)
+def _numberingFromString(c: str) -> t.Optional[str]:
+    '''
+    Cached core of RehearsalMark._getNumberingFromContent for string content.
+
+    >>> expressions._numberingFromString('IV')
+    'roman'
+    >>> print(expressions._numberingFromString('AB'))
+    None
+    '''
+    if c.isdecimal():
+        return 'number'
+
+    # only strings made of roman numeral letters can be roman numerals
+    if _ROMAN_NUMERAL_PATTERN.fullmatch(c):
+        if len(c) == 1:
+            # any single numeral letter is valid; only the small ones count
+            if c in 'IVXivx':
+                return 'roman'  # I, X, V
+            else:
+                return 'alphabetical'  # L, C, D, M
+        try:
+            common.numberTools.fromRoman(c)
+            return 'roman'  # two letters is enough
+        except ValueError:  # e.g., 'VX'
+            pass
+
+    if c in _ASCII_LETTERS:  # a single letter
+        return 'alphabetical'
+    else:
+        return None
+
+
+@lru_cache(256)
+def _accidentalNameForSharpsAndStep(sharps: int, step: str) -> t.Optional[str]:
+    '''
+    Return the name of the accidental that a traditional key signature of
+    `sharps` sharps gives to `step`, or None.
+
+    >>> expressions._accidentalNameForSharpsAndStep(-2, 'E')
+    'flat'
+    >>> expressions._accidentalNameForSharpsAndStep(-2, 'A') is None
+    True
+    '''
+    from music21 import key
+    accidental = key.KeySignature(sharps).accidentalByStep(step)
+    if accidental is None:
+        return None
+    return accidental.name
+
+
+@lru_cache(1)
+def _noSharpsKeySignature():
+    '''
+    The KeySignature that ornaments fall back on when there is none in
+    context.  It is created once and shared, so it must not be changed.
+
+    >>> expressions._noSharpsKeySignature()
+    <music21.key.KeySignature of no sharps or flats>
+    >>> expressions._noSharpsKeySignature() is expressions._noSharpsKeySignature()
+    True
+    '''
+    from music21 import key
+    return key.KeySignature(0)
+
+
+def _setAccidentalsFromKeySignature(notes, keySig) -> None:
+    '''
+    Set the accidental of each note in `notes` to the one `keySig` gives its
+    step, consulting the key signature only once per step.  Every note still
+    gets its own Accidental object.
+
+    >>> notes = [note.Note('B4'), note.Note('C5'), note.Note('B4')]
+    >>> expressions._setAccidentalsFromKeySignature(notes, key.KeySignature(-1))
+    >>> notes
+    [<music21.note.Note B->, <music21.note.Note C>, <music21.note.Note B->]
+    >>> notes[0].pitch.accidental is notes[2].pitch.accidental
+    False
+    '''
+    # a key signature whose altered pitches come only from its sharps can use
+    # the module-level cache of accidental names; setting a pitch's accidental
+    # from a name creates a new Accidental, which is much cheaper than a deepcopy
+    sharps = keySig.sharps
+    if sharps is not None and keySig._alteredPitches is None:
+        for n in notes:
+            n.pitch.accidental = _accidentalNameForSharpsAndStep(sharps, n.step)
+        return
+
+    # explicitly set altered pitches may carry accidentals with their own
+    # display settings, so keep them; accidentalByStep already returns a copy,
+    # so only later notes on the same step need one of their own
+    accidentalsByStep = {}
+    for n in notes:
+        step = n.step
+        if step not in accidentalsByStep:
+            accidentalsByStep[step] = keySig.accidentalByStep(step)
+            n.pitch.accidental = accidentalsByStep[step]
+        else:
+            n.pitch.accidental = copy.deepcopy(accidentalsByStep[step])
+
+
+def _nextAlphabeticalContent(content: str) -> str:
+    nextOrd = ord(content[-1]) + 1
+    if 65 <= nextOrd <= 90 or 97 <= nextOrd <= 122:  # A-Z or a-z
+        return chr(nextOrd)
+    else:
+        return 'A' * (len(content) + 1)
+
+
+def _nextNumberContent(content) -> int:
+    return int(content) + 1
+
+
+def _nextRomanContent(content: str) -> str:
+    return common.toRoman(common.fromRoman(content) + 1)
+
+
+_NEXT_CONTENT_BY_NUMBERING = {
+    'alphabetical': _nextAlphabeticalContent,
+    'number': _nextNumberContent,
+    'roman': _nextRomanContent,
+}
+_VALID_NUMBERINGS = frozenset(('alphabetical', 'roman', 'number', None))
+
+
+# normalized text alternative -> object in repeat.repeatExpressionReference;
+# filled on first use because repeat imports this module
+_repeatExpressionReferencesByText: t.Dict[str, t.Any] = {}
+
+
+def _repeatExpressionReferenceForText(text: str):
+    '''
+    Return the object in repeat.repeatExpressionReference whose
+    text alternatives match `text`, or None.
+
+    >>> expressions._repeatExpressionReferenceForText('d. c.')
+    <music21.repeat.DaCapo 'Da Capo'>
+    >>> print(expressions._repeatExpressionReferenceForText('dolce'))
+    None
+    '''
+    from music21 import repeat
+    if not _repeatExpressionReferencesByText:
+        for obj in repeat.repeatExpressionReference:
+            for candidate in obj._textAlternatives:
+                # the first object in the reference list wins, as for isValidText
+                _repeatExpressionReferencesByText.setdefault(repeat._stripText(candidate), obj)
+    return _repeatExpressionReferencesByText.get(repeat._stripText(text))
+
+
 # ------------------------------------------------------------------------------
 class ExpressionException(exceptions21.Music21Exception):
     pass
@@ -133,8 +300,7 @@ class Expression(base.Music21Object):
         >>> iTurn.name
         'inverted turn'
         '''
-        className = self.__class__.__name__
-        return common.camelCaseToHyphen(className, replacement=' ')
+        return _nameFromClassName(self.__class__.__name__)
 
 # ------------------------------------------------------------------------------
 
@@ -158,7 +324,7 @@ class RehearsalMark(Expression):
     def __init__(self, content=None, *, numbering=None):
         super().__init__()
         self.content = content
-        if numbering not in ('alphabetical', 'roman', 'number', None):
+        if numbering not in _VALID_NUMBERINGS:
             raise ExpressionException(
                 'Numbering must be "alphabetical", "roman", "number", or None')
         self.numbering = numbering
@@ -199,30 +365,7 @@ class RehearsalMark(Expression):
             return 'number'
         if not isinstance(c, str):
             return None
-
-        try:
-            unused = int(c)
-            return 'number'
-        except ValueError:
-            pass
-
-        try:
-            romanValue = common.numberTools.fromRoman(c)
-            if len(c) >= 2:
-                return 'roman'  # two letters is enough
-
-            if romanValue < 50:
-                return 'roman'  # I, X, V
-            else:
-                return 'alphabetical'  # L, C, D, M
-
-        except ValueError:
-            pass
-
-        if c in string.ascii_letters:
-            return 'alphabetical'
-        else:
-            return None
+        return _numberingFromString(c)
 
     def nextContent(self):
         '''
@@ -265,16 +408,10 @@ class RehearsalMark(Expression):
             # duplicate current content
             return self.content * 2
 
-        if numbering == 'alphabetical':
-            nextContent = chr(ord(self.content[-1]) + 1)
-            if nextContent not in string.ascii_letters:
-                return 'A' * (len(self.content) + 1)
-            else:
-                return nextContent
-        elif numbering == 'number':
-            return int(self.content) + 1
-        elif numbering == 'roman':
-            return common.toRoman(common.fromRoman(self.content) + 1)
+        nextContentFunction = _NEXT_CONTENT_BY_NUMBERING.get(numbering)
+        if nextContentFunction is None:
+            return None
+        return nextContentFunction(self.content)
 
     def nextMark(self):
         '''
@@ -346,10 +483,7 @@ class TextExpression(Expression):
         # numerous properties are inherited from TextFormat
         # the text string to be displayed; not that line breaks
         # are given in the xml with this non-printing character: (#)
-        if not isinstance(content, str):
-            self._content = str(content)
-        else:
-            self._content = content
+        self._content = content if isinstance(content, str) else str(content)
 
         # this does not do anything if default y is defined
         self.placement = None
@@ -399,7 +533,7 @@ class TextExpression(Expression):
         return self._content
 
     def _setContent(self, value):
-        self._content = str(value)
+        self._content = value if isinstance(value, str) else str(value)
 
     content = property(_getContent, _setContent,
                        doc='''Get or set the content.
@@ -423,15 +557,14 @@ class TextExpression(Expression):
         # use objects stored in
         # repeat.repeatExpressionReferences for comparison to stored
         # text; if compatible, create and return object
-        from music21 import repeat
-        for obj in repeat.repeatExpressionReference:
-            if obj.isValidText(self._content):
-                re = copy.deepcopy(obj)
-                # set the text to whatever is used here
-                # create a copy of these text expression and set it
-                # this will transfer all positional/formatting settings
-                re.setTextExpression(copy.deepcopy(self))
-                return re
+        obj = _repeatExpressionReferenceForText(self._content)
+        if obj is not None:
+            repExp = copy.deepcopy(obj)
+            # set the text to whatever is used here
+            # create a copy of these text expression and set it
+            # this will transfer all positional/formatting settings
+            repExp.setTextExpression(copy.deepcopy(self))
+            return repExp
         # Return None if it cannot be expressed as a repeat expression
         return None
 
@@ -443,22 +576,150 @@ class TextExpression(Expression):
 
 # ------------------------------------------------------------------------------
 class Ornament(Expression):
+    # callable returning the default `.size`; it is only called when `.size`
+    # is first needed, so ornaments that are never realized do not build intervals
+    _makeDefaultSize: t.Optional[t.Callable[[], interval.IntervalBase]] = None
 
     def __init__(self):
         super().__init__()
         self.connectedToPrevious = True
         # should follow directly on previous; true for most "ornaments".
+        self._size: t.Optional[interval.IntervalBase] = None
+        self._sizeIsDefault = True
+        self._reversedSize: t.Optional[interval.IntervalBase] = None
+
+    @property
+    def size(self) -> t.Optional[interval.IntervalBase]:
+        '''
+        The interval that the ornament moves by, or None if not applicable.
 
-    def realize(self, srcObj):
+        Ornaments create their default size only when it is first used.
+
+        >>> m = expressions.Mordent()
+        >>> m.size
+        <music21.interval.GenericInterval 2>
+        >>> m.size = interval.Interval('m3')
+        >>> m.size
+        <music21.interval.Interval m3>
+
+        >>> print(expressions.Ornament().size)
+        None
+        '''
+        if self._sizeIsDefault:
+            self._sizeIsDefault = False
+            makeDefaultSize = self.__class__._makeDefaultSize
+            if makeDefaultSize is not None:
+                self._size = makeDefaultSize()
+        return self._size
+
+    @size.setter
+    def size(self, value: t.Optional[interval.IntervalBase]):
+        self._size = value
+        self._sizeIsDefault = False
+        self._reversedSize = None
+
+    def __deepcopy__(self, memo=None):
+        '''
+        Ornaments are copied along with every note that carries them, and most
+        of their attributes are bools, numbers, or strings, which deepcopy
+        would return unchanged; those are shared directly.  The cached
+        reversed size is not copied, but recomputed when needed.
+
+        >>> import copy
+        >>> tr = expressions.Trill()
+        >>> tr.nachschlag = True
+        >>> tr._getReversedSize()
+        <music21.interval.GenericInterval -2>
+        >>> tr2 = copy.deepcopy(tr)
+        >>> tr2.nachschlag
+        True
+        >>> tr2.size
+        <music21.interval.GenericInterval 2>
+        >>> tr2.size is tr.size
+        False
+        >>> tr2._getReversedSize()
+        <music21.interval.GenericInterval -2>
+
+        As with any Music21Object, the copy is not in the original's Streams:
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, tr)
+        >>> tr3 = copy.deepcopy(tr)
+        >>> tr3.sites.getSiteCount()
+        0
+        >>> print(tr3.activeSite)
+        None
+        '''
+        shared = {name: value for name, value in self.__dict__.items()
+                  if value.__class__ in (bool, int, float, str)}
+        new = self._deepcopySubclassable(memo, ignoreAttributes={'_reversedSize', *shared})
+        new.__dict__.update(shared)
+        # must do this after copying
+        new.purgeOrphans()
+        return new
+
+    def realize(self, srcObj, *, keySig=None):
         '''
         subclassable method call that takes a sourceObject
         and returns a three-element tuple of a list of notes before the
         "main note" or the result of the expression if it gobbles up the entire note,
         the "main note" itself (or None) to keep processing for ornaments,
         and a list of notes after the "main note"
+
+        Callers that already know the KeySignature governing `srcObj` may pass
+        it as `keySig` so that ornaments which consult the key need not look
+        it up again.
         '''
         return ([], srcObj, [])
 
+    @staticmethod
+    def _getKeySignatureForRealize(
+        srcObj,
+        keySig: t.Optional['music21.key.KeySignature'] = None
+    ) -> 'music21.key.KeySignature':
+        '''
+        Return `keySig` if given, otherwise the KeySignature in context for
+        `srcObj`, or a KeySignature without sharps or flats if there is none.
+
+        The fallback KeySignature is shared between calls, so callers must
+        only read from it.  `key` is imported here rather than at module level
+        because key imports note, which imports this module.
+
+        >>> m = stream.Measure([key.KeySignature(-2), note.Note('C')])
+        >>> expressions.Ornament._getKeySignatureForRealize(m.notes.first())
+        <music21.key.KeySignature of 2 flats>
+        >>> expressions.Ornament._getKeySignatureForRealize(note.Note('C'))
+        <music21.key.KeySignature of no sharps or flats>
+        >>> expressions.Ornament._getKeySignatureForRealize(m.notes.first(),
+        ...                                                 key.KeySignature(3))
+        <music21.key.KeySignature of 3 sharps>
+        '''
+        if keySig is not None:
+            return keySig
+        from music21 import key
+        currentKeySig = srcObj.getContextByClass(key.KeySignature)
+        if currentKeySig is None:
+            currentKeySig = _noSharpsKeySignature()
+        return currentKeySig
+
+    def _getReversedSize(self):
+        '''
+        Return `.size` reversed.  The reversed interval is computed once and
+        reused until `.size` is set again.
+
+        >>> tr = expressions.Trill()
+        >>> tr._getReversedSize()
+        <music21.interval.GenericInterval -2>
+        >>> tr._getReversedSize() is tr._getReversedSize()
+        True
+        >>> tr.size = interval.Interval('m3')
+        >>> tr._getReversedSize()
+        <music21.interval.Interval m-3>
+        '''
+        if self._reversedSize is None:
+            self._reversedSize = self.size.reverse()
+        return self._reversedSize
+
     def fillListOfRealizedNotes(
         self,
         srcObj: 'music21.note.Note',
@@ -476,14 +737,13 @@ class Ornament(Expression):
         # firstNote.expressions = None
         # TODO: clear lyrics.
         firstNote.duration.quarterLength = self.quarterLength
-        secondNote = copy.deepcopy(srcObj)
-        secondNote.duration.quarterLength = self.quarterLength
+        # copying firstNote reuses its duration rather than setting it again
+        secondNote = copy.deepcopy(firstNote)
         # TODO: remove expressions
         # secondNote.expressions = None
         secondNote.transpose(transposeInterval, inPlace=True)
 
-        fillObjects.append(firstNote)
-        fillObjects.append(secondNote)
+        fillObjects.extend((firstNote, secondNote))
 
 
 # ------------------------------------------------------------------------------
@@ -491,14 +751,14 @@ class GeneralMordent(Ornament):
     '''Base class for all Mordent types.
     '''
 
+    _makeDefaultSize = partial(interval.GenericInterval, 2)
+
     def __init__(self):
         super().__init__()
         self.direction = ''  # up or down
-        self.size = None  # interval.Interval (General, etc.) class
         self.quarterLength = 0.125  # 32nd note default
-        self.size = interval.GenericInterval(2)
 
-    def realize(self, srcObj: 'music21.note.Note'):
+    def realize(self, srcObj: 'music21.note.Note', *, keySig=None):
         '''
         Realize a mordent.
 
@@ -524,8 +784,6 @@ class GeneralMordent(Ornament):
         music21.expressions.ExpressionException: Cannot realize a mordent if I do not
             know its direction
         '''
-        from music21 import key
-
         if self.direction not in ('up', 'down'):
             raise ExpressionException('Cannot realize a mordent if I do not know its direction')
         if self.size == '':
@@ -537,18 +795,15 @@ class GeneralMordent(Ornament):
 
         remainderDuration = srcObj.duration.quarterLength - (2 * self.quarterLength)
         if self.direction == 'down':
-            transposeInterval = self.size.reverse()
+            transposeInterval = self._getReversedSize()
         else:
             transposeInterval = self.size
         mordNotes: t.List['music21.note.Note'] = []
         self.fillListOfRealizedNotes(srcObj, mordNotes, transposeInterval)
 
-        currentKeySig = srcObj.getContextByClass(key.KeySignature)
-        if currentKeySig is None:
-            currentKeySig = key.KeySignature(0)
+        currentKeySig = self._getKeySignatureForRealize(srcObj, keySig)
 
-        for n in mordNotes:
-            n.pitch.accidental = currentKeySig.accidentalByStep(n.step)
+        _setAccidentalsFromKeySignature(mordNotes, currentKeySig)
         remainderNote = copy.deepcopy(srcObj)
         remainderNote.duration.quarterLength = remainderDuration
         # TODO clear just mordent here...
@@ -593,9 +848,7 @@ class HalfStepMordent(Mordent):
     <music21.interval.Interval m2>
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('m2')
+    _makeDefaultSize = partial(interval.Interval, 'm2')
 
 
 class WholeStepMordent(Mordent):
@@ -609,9 +862,7 @@ class WholeStepMordent(Mordent):
     <music21.interval.Interval M2>
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('M2')
+    _makeDefaultSize = partial(interval.Interval, 'M2')
 
 
 # ------------------------------------------------------------------------------
@@ -654,9 +905,7 @@ class HalfStepInvertedMordent(InvertedMordent):
     <music21.interval.Interval m2>
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('m2')
+    _makeDefaultSize = partial(interval.Interval, 'm2')
 
 
 class WholeStepInvertedMordent(InvertedMordent):
@@ -670,9 +919,7 @@ class WholeStepInvertedMordent(InvertedMordent):
     <music21.interval.Interval M2>
     '''
 
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('M2')
+    _makeDefaultSize = partial(interval.Interval, 'M2')
 
 
 # ------------------------------------------------------------------------------
@@ -703,10 +950,10 @@ class Trill(Ornament):
 
     Changed in v.7 -- the size should be a generic second.
     '''
+    _makeDefaultSize = partial(interval.GenericInterval, 2)
+
     def __init__(self):
         super().__init__()
-        self.size: interval.IntervalBase = interval.GenericInterval(2)
-
         self.placement = 'above'
         self.nachschlag = False  # play little notes at the end of the trill?
         self.tieAttach = 'all'
@@ -737,7 +984,9 @@ class Trill(Ornament):
 
     def realize(
         self,
-        srcObj: 'music21.note.Note'
+        srcObj: 'music21.note.Note',
+        *,
+        keySig: t.Optional['music21.key.KeySignature'] = None
     ) -> t.Tuple[t.List['music21.note.Note'], None, t.List['music21.note.Note']]:
         '''
         realize a trill.
@@ -778,6 +1027,15 @@ class Trill(Ornament):
           <music21.note.Note C>,
           <music21.note.Note D->], None, [])
 
+        A caller that already knows the key signature can pass it in as `keySig`,
+        which is then used instead of the one in context:
+
+        >>> t1.realize(n1, keySig=key.KeySignature(0))
+        ([<music21.note.Note C>,
+          <music21.note.Note D>,
+          <music21.note.Note C>,
+          <music21.note.Note D>], None, [])
+
 
         Note that if the key contradicts the note of the trill, for instance, here
         having a C-natural rather than a C-sharp, we do not correct the C to C#.
@@ -838,7 +1096,6 @@ class Trill(Ornament):
         # TODO -- if the trill duration is too short, do not raise an error, simple make the
         #    quarterLength even shorter.
 
-        from music21 import key
         if srcObj.duration.quarterLength == 0:
             raise ExpressionException('Cannot steal time from an object with no duration')
         if srcObj.duration.quarterLength < 2 * self.quarterLength:
@@ -847,36 +1104,40 @@ class Trill(Ornament):
             raise ExpressionException('The note is not long enough for a nachschlag')
 
         transposeInterval = self.size
-        transposeIntervalReverse = self.size.reverse()
+        transposeIntervalReverse = self._getReversedSize()
 
         numberOfTrillNotes = int(srcObj.duration.quarterLength / self.quarterLength)
         if self.nachschlag:
             numberOfTrillNotes -= 2
 
         trillNotes: t.List['music21.note.Note'] = []
-        for unused_counter in range(int(numberOfTrillNotes / 2)):
+        numberOfPairs = int(numberOfTrillNotes / 2)
+        if numberOfPairs:
             self.fillListOfRealizedNotes(srcObj, trillNotes, transposeInterval)
+            # copy the first pair rather than re-transposing srcObj for every pair
+            firstPair = tuple(trillNotes)
+            for unused_counter in range(numberOfPairs - 1):
+                trillNotes.extend(copy.deepcopy(n) for n in firstPair)
 
         currentKeySig = None
         setAccidentalFromKeySig = self._setAccidentalFromKeySig
         if setAccidentalFromKeySig:
-            currentKeySig = srcObj.getContextByClass(key.KeySignature)
-            if currentKeySig is None:
-                currentKeySig = key.KeySignature(0)
+            currentKeySig = self._getKeySignatureForRealize(srcObj, keySig)
 
-            for n in trillNotes:
-                if n.pitch.nameWithOctave != srcObj.pitch.nameWithOctave:
-                    # do not correct original note, no matter what.
-                    n.pitch.accidental = currentKeySig.accidentalByStep(n.step)
+            # do not correct original note, no matter what.
+            srcNameWithOctave = srcObj.pitch.nameWithOctave
+            _setAccidentalsFromKeySignature(
+                [n for n in trillNotes if n.pitch.nameWithOctave != srcNameWithOctave],
+                currentKeySig)
 
         if self.nachschlag:
             firstNoteNachschlag = copy.deepcopy(srcObj)
             firstNoteNachschlag.expressions = []
             firstNoteNachschlag.duration.quarterLength = self.quarterLength
 
-            secondNoteNachschlag = copy.deepcopy(srcObj)
-            secondNoteNachschlag.expressions = []
-            secondNoteNachschlag.duration.quarterLength = self.quarterLength
+            # copying the first note, which has no expressions left, avoids
+            # deep-copying srcObj's expressions (including this trill) again
+            secondNoteNachschlag = copy.deepcopy(firstNoteNachschlag)
             secondNoteNachschlag.transpose(transposeIntervalReverse,
                                            inPlace=True)
 
@@ -917,9 +1178,10 @@ class HalfStepTrill(Trill):
       <music21.note.Note C>], None, [])
     '''
 
+    _makeDefaultSize = partial(interval.Interval, 'm2')
+
     def __init__(self):
         super().__init__()
-        self.size = interval.Interval('m2')
         self._setAccidentalFromKeySig = False
 
 
@@ -946,9 +1208,10 @@ class WholeStepTrill(Trill):
       <music21.note.Note C#>], None, [])
     '''
 
+    _makeDefaultSize = partial(interval.Interval, 'M2')
+
     def __init__(self):
         super().__init__()
-        self.size = interval.Interval('M2')
         self._setAccidentalFromKeySig = False
 
 
@@ -975,9 +1238,10 @@ class Schleifer(Ornament):
 
     Changed in v.7 -- size is a Generic second.  removed unused nachschlag component.
     '''
+    _makeDefaultSize = partial(interval.GenericInterval, 2)
+
     def __init__(self):
         super().__init__()
-        self.size = interval.GenericInterval(2)
         self.quarterLength = 0.25
 
 
@@ -988,14 +1252,15 @@ class Turn(Ornament):
 
     Changed in v.7 -- size is a Generic second.  removed unused nachschlag component.
     '''
+    _makeDefaultSize = partial(interval.GenericInterval, 2)
+
     def __init__(self):
         super().__init__()
-        self.size = interval.GenericInterval(2)
         self.placement = 'above'
         self.tieAttach = 'all'
         self.quarterLength = 0.25
 
-    def realize(self, srcObject: 'music21.note.Note'):
+    def realize(self, srcObject: 'music21.note.Note', *, keySig=None):
         '''
         realize a turn.
 
@@ -1035,8 +1300,6 @@ class Turn(Ornament):
         Traceback (most recent call last):
         music21.expressions.ExpressionException: The note is not long enough to realize a turn
         '''
-        from music21 import key
-
         if self.size is None:
             raise ExpressionException('Cannot realize a turn if there is no size given')
         if srcObject.duration.quarterLength == 0:
@@ -1046,39 +1309,28 @@ class Turn(Ornament):
 
         remainderDuration = srcObject.duration.quarterLength - 4 * self.quarterLength
         transposeIntervalUp = self.size
-        transposeIntervalDown = self.size.reverse()
-        turnNotes = []
-
-        firstNote = copy.deepcopy(srcObject)
-        firstNote.expressions = []
-        firstNote.duration.quarterLength = self.quarterLength
-        firstNote.transpose(transposeIntervalUp, inPlace=True)
+        transposeIntervalDown = self._getReversedSize()
 
+        # copy srcObject (and its expressions) only once; the other turn notes
+        # are copies of this expression-less note of the right length
         secondNote = copy.deepcopy(srcObject)
         secondNote.expressions = []
         secondNote.duration.quarterLength = self.quarterLength
 
-        thirdNote = copy.deepcopy(srcObject)
-        thirdNote.expressions = []
-        thirdNote.duration.quarterLength = self.quarterLength
+        firstNote = copy.deepcopy(secondNote)
+        firstNote.transpose(transposeIntervalUp, inPlace=True)
+
+        thirdNote = copy.deepcopy(secondNote)
         thirdNote.transpose(transposeIntervalDown, inPlace=True)
 
-        fourthNote = copy.deepcopy(srcObject)
-        fourthNote.expressions = []
-        fourthNote.duration.quarterLength = self.quarterLength
+        fourthNote = copy.deepcopy(secondNote)
 
-        turnNotes.append(firstNote)
-        turnNotes.append(secondNote)
-        turnNotes.append(thirdNote)
-        turnNotes.append(fourthNote)
+        turnNotes = [firstNote, secondNote, thirdNote, fourthNote]
 
-        currentKeySig = srcObject.getContextByClass(key.KeySignature)
-        if currentKeySig is None:
-            currentKeySig = key.KeySignature(0)
+        currentKeySig = self._getKeySignatureForRealize(srcObject, keySig)
 
-        for n in turnNotes:
-            # TODO: like in trill, do not affect original note.
-            n.pitch.accidental = currentKeySig.accidentalByStep(n.step)
+        # TODO: like in trill, do not affect original note.
+        _setAccidentalsFromKeySignature(turnNotes, currentKeySig)
 
         remainderNote = copy.deepcopy(srcObject)
         remainderNote.duration.quarterLength = remainderDuration
@@ -1097,11 +1349,9 @@ class GeneralAppoggiatura(Ornament):
     # up or down -- up means the grace note is below and goes up to the actual note
     direction = ''
 
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval(2)
+    _makeDefaultSize = partial(interval.Interval, 2)
 
-    def realize(self, srcObj):
+    def realize(self, srcObj, *, keySig=None):
         '''
         realize an appoggiatura
 
@@ -1125,7 +1375,6 @@ class GeneralAppoggiatura(Ornament):
 
         :type srcObj: base.Music21Object
         '''
-        from music21 import key
         if self.direction not in ('up', 'down'):
             raise ExpressionException(
                 'Cannot realize an Appoggiatura if I do not know its direction')
@@ -1139,7 +1388,7 @@ class GeneralAppoggiatura(Ornament):
         if self.direction == 'down':
             transposeInterval = self.size
         else:
-            transposeInterval = self.size.reverse()
+            transposeInterval = self._getReversedSize()
 
         appoggiaturaNote = copy.deepcopy(srcObj)
         appoggiaturaNote.duration.quarterLength = newDuration
@@ -1148,10 +1397,6 @@ class GeneralAppoggiatura(Ornament):
         remainderNote = copy.deepcopy(srcObj)
         remainderNote.duration.quarterLength = newDuration
 
-        currentKeySig = srcObj.getContextByClass(key.KeySignature)
-        if currentKeySig is None:
-            currentKeySig = key.KeySignature(0)
-
         # TODO clear just mordent here...
         return ([appoggiaturaNote], remainderNote, [])
 
@@ -1161,15 +1406,11 @@ class Appoggiatura(GeneralAppoggiatura):
 
 
 class HalfStepAppoggiatura(Appoggiatura):
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('m2')
+    _makeDefaultSize = partial(interval.Interval, 'm2')
 
 
 class WholeStepAppoggiatura(Appoggiatura):
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('M2')
+    _makeDefaultSize = partial(interval.Interval, 'M2')
 
 
 class InvertedAppoggiatura(GeneralAppoggiatura):
@@ -1177,15 +1418,11 @@ class InvertedAppoggiatura(GeneralAppoggiatura):
 
 
 class HalfStepInvertedAppoggiatura(InvertedAppoggiatura):
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('m2')
+    _makeDefaultSize = partial(interval.Interval, 'm2')
 
 
 class WholeStepInvertedAppoggiatura(InvertedAppoggiatura):
-    def __init__(self):
-        super().__init__()
-        self.size = interval.Interval('M2')
+    _makeDefaultSize = partial(interval.Interval, 'M2')
 
 # ------------------------------------------------------------------------------
 
@@ -1194,6 +1431,30 @@ class TremoloException(exceptions21.Music21Exception):
     pass
 
 
+def _checkNumberOfMarks(num) -> int:
+    '''
+    Return `num` as an int if it is a valid number of tremolo marks (0 to 8),
+    otherwise raise a TremoloException.  Ints, the usual case, are checked
+    without conversion.
+
+    >>> expressions._checkNumberOfMarks(2)
+    2
+    >>> expressions._checkNumberOfMarks('4')
+    4
+    >>> expressions._checkNumberOfMarks(None)
+    Traceback (most recent call last):
+    music21.expressions.TremoloException: Number of marks must be a number from 0 to 8
+    '''
+    if type(num) is not int:  # pylint: disable=unidiomatic-typecheck
+        try:
+            num = int(num)
+        except (TypeError, ValueError) as e:
+            raise TremoloException('Number of marks must be a number from 0 to 8') from e
+    if not 0 <= num <= 8:
+        raise TremoloException('Number of marks must be a number from 0 to 8')
+    return num
+
+
 class Tremolo(Ornament):
     '''
     A tremolo ornament represents a single-note tremolo, whether measured or unmeasured.
@@ -1219,6 +1480,7 @@ class Tremolo(Ornament):
         super().__init__()
         self.measured = True
         self._numberOfMarks = 3
+        self._lengthOfEach = 0.125  # quarterLength of each realized note: 2 ** -numberOfMarks
 
     @property
     def numberOfMarks(self):
@@ -1229,17 +1491,11 @@ class Tremolo(Ornament):
 
     @numberOfMarks.setter
     def numberOfMarks(self, num):
-        try:
-            num = int(num)
-            if num < 0 or num > 8:
-                raise ValueError(str(num))
-            self._numberOfMarks = num
-        except ValueError as ve:
-            raise TremoloException(
-                'Number of marks must be a number from 0 to 8'
-            ) from ve
-
-    def realize(self, srcObj: 'music21.note.Note'):
+        num = _checkNumberOfMarks(num)
+        self._numberOfMarks = num
+        self._lengthOfEach = 2.0 ** -num
+
+    def realize(self, srcObj: 'music21.note.Note', *, keySig=None):
         '''
         Realize the ornament
 
@@ -1283,7 +1539,7 @@ class Tremolo(Ornament):
         {0.0} <music21.note.Note C>
         {0.5} <music21.note.Note C>
         '''
-        lengthOfEach = 2**(-1 * self.numberOfMarks)
+        lengthOfEach = self._lengthOfEach
         objsConverted = []
         eRemain = copy.deepcopy(srcObj)
         if self in eRemain.expressions:
@@ -1417,13 +1673,7 @@ class TremoloSpanner(spanner.Spanner):
 
     @numberOfMarks.setter
     def numberOfMarks(self, num):
-        try:
-            num = int(num)
-            if num < 0 or num > 8:
-                raise ValueError(str(num))
-            self._numberOfMarks = num
-        except ValueError as ve:
-            raise TremoloException('Number of marks must be a number from 0 to 8') from ve
+        self._numberOfMarks = _checkNumberOfMarks(num)
 
 
 # ------------------------------------------------------------------------------
@@ -1446,6 +1696,35 @@ class Test(unittest.TestCase):
         self.assertEqual(st1n[2].name, 'D')
         self.assertEqual(st1n[2].quarterLength, 3.75)
 
+    def testRealizeManyExpressions(self):
+        from music21 import note
+        n1 = note.Note('D4')
+        n1.quarterLength = 4
+        n1.expressions = [Fermata() for _ in range(150)]
+        n1.expressions.append(WholeStepMordent())
+        expList = realizeOrnaments(n1)
+        # all expressions are processed, not just the first hundred
+        self.assertEqual([n.name for n in expList], ['D', 'C', 'D'])
+        self.assertEqual(expList[-1].expressions, [])
+
+    def testRealizeDoesNotShareAccidentals(self):
+        from music21 import key
+        from music21 import note
+        keySigs = [key.KeySignature(-2), key.KeySignature()]
+        keySigs[1].alteredPitches = ['B-', 'E-']
+        for ks in keySigs:
+            n1 = note.Note('A4')
+            n1.quarterLength = 2
+            accidentals = []
+            for unused in range(2):
+                before, unused_main, after = Trill().realize(n1, keySig=ks)
+                for n in before + after:
+                    if n.pitch.accidental is not None:
+                        self.assertEqual(n.pitch.accidental.name, 'flat')
+                        accidentals.append(n.pitch.accidental)
+            self.assertGreater(len(accidentals), 2)
+            self.assertEqual(len({id(a) for a in accidentals}), len(accidentals))
+
     def testGetRepeatExpression(self):
         from music21 import expressions
 
@@ -1456,32 +1735,32 @@ class Test(unittest.TestCase):
         te = expressions.TextExpression('d.c.')
         self.assertEqual(str(te.getRepeatExpression()),
                          "<music21.repeat.DaCapo 'd.c.'>")
-        re = te.getRepeatExpression()
-        self.assertEqual(re.getTextExpression().content, 'd.c.')
+        repExp = te.getRepeatExpression()
+        self.assertEqual(repExp.getTextExpression().content, 'd.c.')
 
         te = expressions.TextExpression('DC al coda')
         self.assertEqual(str(te.getRepeatExpression()),
                          "<music21.repeat.DaCapoAlCoda 'DC al coda'>")
-        re = te.getRepeatExpression()
-        self.assertEqual(re.getTextExpression().content, 'DC al coda')
+        repExp = te.getRepeatExpression()
+        self.assertEqual(repExp.getTextExpression().content, 'DC al coda')
 
         te = expressions.TextExpression('DC al fine')
         self.assertEqual(str(te.getRepeatExpression()),
                          "<music21.repeat.DaCapoAlFine 'DC al fine'>")
-        re = te.getRepeatExpression()
-        self.assertEqual(re.getTextExpression().content, 'DC al fine')
+        repExp = te.getRepeatExpression()
+        self.assertEqual(repExp.getTextExpression().content, 'DC al fine')
 
         te = expressions.TextExpression('ds al coda')
         self.assertEqual(str(te.getRepeatExpression()),
                          "<music21.repeat.DalSegnoAlCoda 'ds al coda'>")
-        re = te.getRepeatExpression()
-        self.assertEqual(re.getTextExpression().content, 'ds al coda')
+        repExp = te.getRepeatExpression()
+        self.assertEqual(repExp.getTextExpression().content, 'ds al coda')
 
         te = expressions.TextExpression('d.s. al fine')
         self.assertEqual(str(te.getRepeatExpression()),
                          "<music21.repeat.DalSegnoAlFine 'd.s. al fine'>")
-        re = te.getRepeatExpression()
-        self.assertEqual(re.getTextExpression().content, 'd.s. al fine')
+        repExp = te.getRepeatExpression()
+        self.assertEqual(repExp.getTextExpression().content, 'd.s. al fine')
 
     def testExpandTurns(self):
         from music21 import note
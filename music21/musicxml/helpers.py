@@ -9,10 +9,14 @@
 # Copyright:    Copyright © 2013-2020 Michael Scott Asato Cuthbert and the music21 Project
 # License:      BSD, see license.txt
 # ------------------------------------------------------------------------------
-import copy
+import re
 from xml.etree.ElementTree import tostring as et_tostring
 from music21 import meter
 
+# leading digits of a measure number, then any suffix
+_MEASURE_NUMBER_PATTERN = re.compile(r'(\d*)(.*)', re.DOTALL)
+
+
 def dumpString(obj, *, noCopy=False) -> str:
     r'''
     wrapper around xml.etree.ElementTree that returns a string
@@ -30,25 +34,51 @@ def dumpString(obj, *, noCopy=False) -> str:
     True
     >>> dumpString(e)
     '<accidental>∆</accidental>'
+
+    Attributes are written in sorted order:
+
+    >>> e.set('size', 'large')
+    >>> e.set('parentheses', 'yes')
+    >>> dumpString(e)
+    '<accidental parentheses="yes" size="large">∆</accidental>'
+
+    Unless `noCopy` is True, `obj` itself is left as it was:
+
+    >>> list(e.attrib)
+    ['size', 'parentheses']
     '''
     if noCopy is False:
-        xmlEl = copy.deepcopy(obj)  # adds 5% overhead
-    else:
-        xmlEl = obj
-    indent(xmlEl)  # adds 5% overhead
-
-    for el in xmlEl.iter():
-        attrib = el.attrib
-        if len(attrib) > 1:
-            # adjust attribute order, e.g. by sorting
-            attribs = sorted(attrib.items())
-            attrib.clear()
-            attrib.update(attribs)
-    xStr = et_tostring(xmlEl, encoding='unicode')
+        # rather than copying the whole tree, remember the whitespace that
+        # indent() may replace and the attribute orders that may change,
+        # and put them back once the string is made.
+        originalWhitespace = [(el, el.text, el.tail) for el in obj.iter()]
+        originalAttribs = []
+    try:
+        indent(obj)  # adds 5% overhead
+
+        for el in obj.iter():
+            attrib = el.attrib
+            if len(attrib) > 1:
+                # adjust attribute order, e.g. by sorting; most elements are
+                # already in order and need not be rebuilt
+                attribs = sorted(attrib.items())
+                if list(attrib) != [k for k, unused_v in attribs]:
+                    if noCopy is False:
+                        originalAttribs.append((attrib, list(attrib.items())))
+                    attrib.clear()
+                    attrib.update(attribs)
+        xStr = et_tostring(obj, encoding='unicode')
+    finally:
+        if noCopy is False:
+            for el, text, tail in originalWhitespace:
+                el.text = text
+                el.tail = tail
+            for attrib, attribs in originalAttribs:
+                attrib.clear()
+                attrib.update(attribs)
     xStr = xStr.rstrip()
     return xStr
 
-
 def dump(obj):
     r'''
     wrapper around xml.etree.ElementTree that prints a string
@@ -70,29 +100,56 @@ def dump(obj):
     print(dumpString(obj))
 
 
-def indent(elem, level=0):
+def _isBlank(text) -> bool:
+    r'''
+    Return True if `text` is None or contains only whitespace.
+
+    >>> from music21.musicxml.helpers import _isBlank
+    >>> _isBlank(None), _isBlank('\n  '), _isBlank(' 4 ')
+    (True, True, False)
     '''
+    return not text or not text.strip()
+
+
+def indent(elem, level=0):
+    r'''
     helper method, indent an element in place:
+
+    >>> from xml.etree.ElementTree import fromstring as El, tostring
+    >>> from music21.musicxml.helpers import indent
+    >>> root = El('<clef><sign>G</sign><line>4</line></clef>')
+    >>> indent(root)
+    >>> tostring(root, encoding='unicode')
+    '<clef>\n  <sign>G</sign>\n  <line>4</line>\n</clef>\n'
+
+    The tree is walked with an explicit stack rather than by recursion,
+    so that deep trees cost no Python stack frames.
     '''
-    i = '\n' + level * '  '
-    lenL = len(elem)
-    if lenL:
-        if not elem.text or not elem.text.strip():
-            elem.text = i + '  '
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-
-        subElem = None
-        for subElem in elem:
-            indent(subElem, level + 1)
-        if subElem is not None:  # last el...
-            subElem.tail = i
-
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = '\n' + level * '  '
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+    indents = ['\n']  # indents[n] is a newline followed by n levels of indentation
+
+    def indentForLevel(n):
+        while len(indents) <= n:
+            indents.append(indents[-1] + '  ')
+        return indents[n]
+
+    if (level or len(elem)) and _isBlank(elem.tail):
+        elem.tail = indentForLevel(level)
+    if len(elem) == 0:
+        return
+
+    stack = [(elem, level)]
+    while stack:
+        parent, parentLevel = stack.pop()
+        parentIndent = indentForLevel(parentLevel)
+        childIndent = indentForLevel(parentLevel + 1)
+        if _isBlank(parent.text):
+            parent.text = childIndent
+        for subElem in parent:
+            if _isBlank(subElem.tail):
+                subElem.tail = childIndent
+            if len(subElem):
+                stack.append((subElem, parentLevel + 1))
+        parent[-1].tail = parentIndent  # last el...
 
 
 def insertBeforeElements(root, insert, tagList=None):
@@ -127,15 +184,13 @@ def insertBeforeElements(root, insert, tagList=None):
         <bar />
     </clef>
     '''
-    if not tagList:
-        root.append(insert)
-        return
-    insertIndices = {len(root)}
-    # Iterate children only, not grandchildren
-    for i, child in enumerate(root.findall('*')):
-        if child.tag in tagList:
-            insertIndices.add(i)
-    root.insert(min(insertIndices), insert)
+    if tagList:
+        # Iterate children only, not grandchildren
+        for i, child in enumerate(root):
+            if child.tag in tagList:
+                root.insert(i, insert)
+                return
+    root.append(insert)
 
 
 def measureNumberComesBefore(mNum1: str, mNum2: str) -> bool:
@@ -159,27 +214,14 @@ def measureNumberComesBefore(mNum1: str, mNum2: str) -> bool:
     True
     >>> measureNumberComesBefore('23b', '23b')
     False
+    >>> measureNumberComesBefore('9', '10a')
+    True
     '''
-    def splitSuffix(measureNumber):
-        number = ''
-        for char in measureNumber:
-            if char.isnumeric():
-                number += char
-            else:
-                break
-        suffix = measureNumber[len(number):]
-        return number, suffix
-
     if mNum1 == mNum2:
         return False
-    m1Numeric, m1Suffix = splitSuffix(mNum1)
-    m2Numeric, m2Suffix = splitSuffix(mNum2)
-    if int(m1Numeric) != int(m2Numeric):
-        return int(m1Numeric) < int(m2Numeric)
-    else:
-        sortedSuffixes = sorted([m1Suffix, m2Suffix])
-        return m1Suffix is sortedSuffixes[0]
-
+    m1Numeric, m1Suffix = _MEASURE_NUMBER_PATTERN.match(mNum1).groups()
+    m2Numeric, m2Suffix = _MEASURE_NUMBER_PATTERN.match(mNum2).groups()
+    return (int(m1Numeric), m1Suffix) < (int(m2Numeric), m2Suffix)
 
 def isFullMeasureRest(r: 'music21.note.Rest') -> bool:
     isFullMeasure = False
@@ -30,6 +30,21 @@ from music21 import environment
 environLocal = environment.Environment('repeat')
 
 
+def _stripText(s):
+    '''
+    Normalize repeat expression text for comparison:
+    remove all spaces and periods, and make lower case.
+
+    >>> repeat._stripText(' D. C. al Fine')
+    'dcalfine'
+    '''
+    s = s.strip()
+    s = s.replace(' ', '')
+    s = s.replace('.', '')
+    s = s.lower()
+    return s
+
+
 # ------------------------------------------------------------------------------
 class RepeatMark(prebase.ProtoM21Object):
     '''
@@ -153,16 +168,9 @@ class RepeatExpression(RepeatMark, expressions.Expression):
     def isValidText(self, value):
         '''Return True or False if the supplied text could be used for this RepeatExpression.
         '''
-        def stripText(s):
-            # remove all spaces, punctuation, and make lower
-            s = s.strip()
-            s = s.replace(' ', '')
-            s = s.replace('.', '')
-            s = s.lower()
-            return s
+        value = _stripText(value)
         for candidate in self._textAlternatives:
-            candidate = stripText(candidate)
-            value = stripText(value)
+            candidate = _stripText(candidate)
             if value == candidate:
                 return True
         return False
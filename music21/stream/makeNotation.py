@@ -14,6 +14,8 @@
 # -----------------------------------------------------------------------------
 
 import copy
+from functools import lru_cache
+import inspect
 import unittest
 import typing as t
 from fractions import Fraction  # typing only
@@ -1525,6 +1527,62 @@ def realizeOrnaments(s: StreamType) -> StreamType:
     TODO: does not work for Gapful streams because it uses append rather
        than the offset of the original
     '''
+    newStream, unused_keySig = _realizeOrnamentsWithKeySignature(s, None)
+    return newStream
+
+
+@lru_cache(64)
+def _realizeAcceptsKeySig(expressionClass) -> bool:
+    '''
+    Return True if the `realize` method of `expressionClass` accepts a keySig
+    keyword, as every Ornament does.  Subclasses written before keySig was
+    added may override `realize(self, srcObj)` without it.
+
+    >>> stream.makeNotation._realizeAcceptsKeySig(expressions.Trill)
+    True
+    >>> class OldTrill(expressions.Trill):
+    ...     def realize(self, srcObj):
+    ...         return super().realize(srcObj)
+    >>> stream.makeNotation._realizeAcceptsKeySig(OldTrill)
+    False
+    '''
+    try:
+        parameters = inspect.signature(expressionClass.realize).parameters
+    except (TypeError, ValueError):  # pragma: no cover
+        return False
+    return ('keySig' in parameters
+            or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()))
+
+
+def _realizeOrnamentsWithKeySignature(
+    s: StreamType,
+    currentKeySig: t.Optional[key.KeySignature]
+) -> t.Tuple[StreamType, t.Optional[key.KeySignature]]:
+    '''
+    Helper for :func:`realizeOrnaments` that tracks the KeySignature in effect
+    while walking `s`, so that each ornament is handed the key signature
+    instead of searching the note's context for it.
+
+    `currentKeySig` is the KeySignature in effect at the start of `s`, or None
+    if it is not known, in which case the ornaments look up their own.
+    Returns the new stream and the KeySignature in effect at the end of `s`.
+    Only a Measure passes its last KeySignature on to what follows it, since
+    Voices and Parts run in parallel with their siblings.
+
+    A substream is only handed `currentKeySig` if it holds for every note in
+    it.  A substream during which another KeySignature in `s` takes effect
+    (such as a Voice in a Measure with a key change) is passed None, so that
+    its ornaments look up the key signature in context: the loop over `s` only
+    reaches that KeySignature after the whole substream has been realized.
+
+    >>> m = stream.Measure([key.KeySignature(-3), note.Note('D', type='half')])
+    >>> m.notes.first().expressions.append(expressions.InvertedMordent())
+    >>> newMeasure, ks = stream.makeNotation._realizeOrnamentsWithKeySignature(m, None)
+    >>> ks
+    <music21.key.KeySignature of 3 flats>
+    >>> list(newMeasure.notes)
+    [<music21.note.Note D>, <music21.note.Note E->, <music21.note.Note D>]
+    '''
     newStream = s.cloneEmpty(derivationMethod='realizeOrnaments')
     newStream.offset = s.offset
 
@@ -1534,7 +1592,10 @@ def realizeOrnaments(s: StreamType) -> StreamType:
             if not hasattr(exp, 'realize'):
                 continue
             # else:
-            before, during, after = exp.realize(innerElement)
+            if currentKeySig is not None and _realizeAcceptsKeySig(type(exp)):
+                before, during, after = exp.realize(innerElement, keySig=currentKeySig)
+            else:
+                before, during, after = exp.realize(innerElement)
             elementHasBeenRealized = True
             for n in before:
                 newStream.append(n)
@@ -1545,18 +1606,33 @@ def realizeOrnaments(s: StreamType) -> StreamType:
         if elementHasBeenRealized is False:
             newStream.append(innerElement)
 
+    # offsets of the KeySignatures in s that the loop has not reached yet
+    pendingKeySigOffsets = [s.elementOffset(ks) for ks in s.getElementsByClass(key.KeySignature)]
+
     # If this streamObj contains more streams (i.e., a Part that contains
     # multiple measures):
     for element in s:
         if element.isStream:
-            newStream.append(realizeOrnaments(element))
+            subStreamStartKeySig = currentKeySig
+            if pendingKeySigOffsets:
+                elementEnd = s.elementOffset(element) + element.highestTime
+                if pendingKeySigOffsets[0] < elementEnd:
+                    subStreamStartKeySig = None
+            newSubStream, subStreamKeySig = _realizeOrnamentsWithKeySignature(
+                element, subStreamStartKeySig)
+            newStream.append(newSubStream)
+            if 'Measure' in element.classes and subStreamKeySig is not None:
+                currentKeySig = subStreamKeySig
         else:
+            if isinstance(element, key.KeySignature):
+                currentKeySig = element
+                pendingKeySigOffsets.pop(0)
             if hasattr(element, 'expressions'):
                 realizeElementExpressions(element)
             else:
                 newStream.append(element)
 
-    return newStream
+    return newStream, currentKeySig
 
 
 def moveNotesToVoices(source: StreamType,
@@ -2043,6 +2119,35 @@ class Test(unittest.TestCase):
             makeAccidentalsInMeasureStream(p.measure(1))
         self.assertIn('must contain only Measures', str(cm.exception))
 
+    def testRealizeOrnamentsKeyChangeInVoicedMeasure(self):
+        from music21 import expressions
+        from music21 import stream
+        m = stream.Measure()
+        m.insert(0, key.KeySignature(0))
+        v = stream.Voice()
+        v.append(note.Note('C4', type='half'))
+        n = note.Note('D4', type='half')
+        n.expressions.append(expressions.InvertedMordent())
+        v.append(n)
+        m.insert(0, v)
+        m.insert(2, key.KeySignature(-3))
+        post = realizeOrnaments(m)
+        self.assertEqual([n.nameWithOctave for n in post.recurse().notes],
+                         ['C4', 'D4', 'E-4', 'D4'])
+
+    def testRealizeOrnamentsWithoutKeySigArgument(self):
+        from music21 import expressions
+        from music21 import stream
+
+        class OldStyleMordent(expressions.InvertedMordent):
+            def realize(self, srcObj):
+                return super().realize(srcObj)
+
+        m = stream.Measure([key.KeySignature(-3), note.Note('D4', type='half')])
+        m.notes.first().expressions.append(OldStyleMordent())
+        post = realizeOrnaments(m)
+        self.assertEqual([n.nameWithOctave for n in post.notes], ['D4', 'E-4', 'D4'])
+
 
 # -----------------------------------------------------------------------------
 
@@ -9,8 +9,16 @@
 # Copyright:    Copyright © 2014-15 Michael Scott Asato Cuthbert and the music21 Project
 # License:      BSD, see license.txt
 # ------------------------------------------------------------------------------
+from functools import lru_cache
+import os
 import sys
 
+try:
+    # noinspection PyPackageRequirements
+    import coverage  # type: ignore
+except ImportError:
+    coverage = None
+
 omit_modules = [
     'music21/ext/*',
     'dist/dist.py',
@@ -25,30 +33,45 @@ omit_modules = [
 ]
 
 # THESE ARE NOT RELEVANT FOR coveralls.io -- edit .coveragerc to change that
+# coverage searches the whole source with these (re.MULTILINE), so they are
+# anchored to the start of a line and match no surrounding whitespace or
+# newlines, which would also exclude the neighboring lines.
 exclude_lines = [
-    r'\s*import music21\s*',
-    r'\s*music21.mainTest\(\)\s*',
-    r'.*#\s*pragma:\s*no cover.*',
-    r'class TestExternal.*',
+    r'^[ \t]*import music21\b',
+    r'^[ \t]*music21\.mainTest\(',
+    r'#\s*pragma:\s*no cover',
+    r'^[ \t]*class TestExternal',
 ]
 
 
-def getCoverage(overrideVersion=False):
-    # Note the .minor == 8 -- that makes it only run on 3.8
-    # run on Py 3.8 -- to get Py 3.9/3.10 timing...
-    if overrideVersion or sys.version_info.minor == 8:
-        try:
-            # noinspection PyPackageRequirements
-            import coverage  # type: ignore
-            cov = coverage.Coverage(omit=omit_modules)
-            for e in exclude_lines:
-                cov.exclude(e, which='exclude')
-            cov.start()
-            import music21  # pylint: disable=unused-import
-        except ImportError:
-            cov = None
-    else:
-        cov = None
+# cached so that several test drivers in one process share a single Coverage
+# object rather than building and starting a second one
+@lru_cache(maxsize=4)
+def getCoverage(overrideVersion=False, *, parallel=False):
+    # Coverage only runs when asked for, with MUSIC21_COVERAGE (as the CI job
+    # that reports to coveralls does) or COVERAGE_CORE, so that other runs
+    # keep their normal timing.
+    # With parallel=True each process saves to its own suffixed data file,
+    # to be merged by combineCoverage() once all of them have finished.
+    if coverage is None:
+        return None
+    if not (overrideVersion
+            or os.environ.get('MUSIC21_COVERAGE')
+            or os.environ.get('COVERAGE_CORE')):
+        return None
+
+    if sys.version_info >= (3, 12):
+        # the sys.monitoring core (PEP 669) traces far more cheaply than
+        # sys.settrace; an explicit COVERAGE_CORE still wins.
+        os.environ.setdefault('COVERAGE_CORE', 'sysmon')
+    # limiting measurement to music21 lets coverage reject every other
+    # file before checking it against omit_modules
+    cov = coverage.Coverage(source=['music21'],
+                            omit=omit_modules,
+                            data_suffix=True if parallel else None)
+    for e in exclude_lines:
+        cov.exclude(e, which='exclude')
+    cov.start()
     return cov
 
 def startCoverage(cov):
@@ -59,3 +82,14 @@ def stopCoverage(cov):
     if cov is not None:
         cov.stop()
         cov.save()
+
+def combineCoverage():
+    '''
+    Merge the data files saved by processes that ran getCoverage(parallel=True)
+    into the main coverage data file.
+    '''
+    if coverage is None:
+        return
+    cov = coverage.Coverage(source=['music21'], omit=omit_modules)
+    cov.combine()
+    cov.save()